@@ -9,22 +9,34 @@ Features:
 - Direct master file download
 """
 
+import gzip
+import hashlib
+import json
 import os
-import sys
 import time
-import queue
 import threading
 import io
+from collections import OrderedDict, deque
+import atexit
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows has no fcntl
+    fcntl = None
 
-from flask import Flask, render_template_string, request, jsonify, Response, send_file
+from flask import Flask, render_template, request, jsonify, Response, send_from_directory
+from werkzeug.exceptions import NotFound
 
 from config import OUTPUT_DIR, PDF_DIR, EXCEL_DIR, GOOGLE_SHEETS_CONFIG
 from utils.logger import get_logger, setup_logger
-from scraper.fetch_pdf_links import fetch_pdf_links, get_available_months
+from scraper.fetch_pdf_links import (
+    fetch_pdf_links_cached,
+    get_available_months,
+    invalidate_links_cache,
+)
 from downloader.download_pdfs import download_pdfs
 from extractor.pdf_to_excel import process_all_pdfs
 from transformer.build_master_excel import build_master_excel_for_month, build_consolidated_master
@@ -33,437 +45,497 @@ from utils.google_sheets_handler import GoogleSheetsHandler
 
 app = Flask(__name__)
 
+# Compress JSON/HTML responses when flask-compress is installed. SSE is
+# deliberately excluded (compression buffers frames, breaking per-event
+# flushes) and so is the XLSX download (already deflate-compressed).
+# The dashboard itself carries its own precompressed bodies, which
+# flask-compress leaves alone because Content-Encoding is already set.
+try:
+    from flask_compress import Compress
+except ImportError:
+    pass
+else:
+    app.config['COMPRESS_MIMETYPES'] = ['application/json', 'text/html']
+    app.config['COMPRESS_MIN_SIZE'] = 256  # month lists are small but repetitive
+    Compress(app)
+
+# Serialize JSON responses through orjson's C encoder when available -
+# jsonify and request.get_json go through the provider, so every route
+# benefits without changes. Stdlib json remains the fallback.
+try:
+    import orjson
+except ImportError:
+    pass
+else:
+    from flask.json.provider import JSONProvider
+
+    class ORJSONProvider(JSONProvider):
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(obj).decode()
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+    app.json = ORJSONProvider(app)
+
 # Setup logging
 logger = setup_logger()
 
-# Progress queue for SSE
-progress_queue = queue.Queue()
-
-# Store active sessions
-active_sessions = {}
-
-
-# ============== DASHBOARD HTML TEMPLATE ==============
-# UI REDESIGN: Updated with premium glassmorphism design and multi-select timeline
-# All existing functionality preserved - only UI structure and styling changed
-# Added Google Sheet Link injection
-DASHBOARD_HTML = '''<!DOCTYPE html>
-<html lang="en"><head>
-<meta charset="utf-8"/>
-<meta content="width=device-width, initial-scale=1.0" name="viewport"/>
-<title>FADA Data Export Dashboard</title>
-<script src="https://cdn.tailwindcss.com?plugins=forms,typography"></script>
-<link href="https://fonts.googleapis.com" rel="preconnect"/>
-<link crossorigin="" href="https://fonts.gstatic.com" rel="preconnect"/>
-<link href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&family=Playfair+Display:ital,wght@0,600;0,700;1,600&display=swap" rel="stylesheet"/>
-<link href="https://fonts.googleapis.com/icon?family=Material+Icons+Round" rel="stylesheet"/>
-<script>
-    tailwind.config = {
-        darkMode: "class",
-        theme: {
-            extend: {
-                colors: {
-                    primary: "#6366f1", 
-                    accent: "#06b6d4",
-                    dark: {
-                        950: "#02040a",
-                        900: "#0f172a",
-                        800: "#1e293b",
-                        700: "#334155", 
-                    },
-                },
-                fontFamily: {
-                    sans: ['Inter', 'sans-serif'],
-                    display: ['Playfair Display', 'serif'],
-                },
-                backgroundImage: {
-                    'grid-pattern': "url(\\"data:image/svg+xml,%3Csvg width='40' height='40' viewBox='0 0 40 40' xmlns='http://www.w3.org/2000/svg'%3E%3Cg fill='%236366f1' fill-opacity='0.05' fill-rule='evenodd'%3E%3Cpath d='M0 40L40 0H20L0 20M40 40V20L20 40'/%3E%3C/g%3E%3C/svg%3E\\")",
-                    'gradient-dark': 'linear-gradient(to bottom right, #0f172a, #1e1b4b, #000000)',
-                },
-                boxShadow: {
-                    'glow': '0 0 20px rgba(99, 102, 241, 0.5)',
-                    'glow-accent': '0 0 15px rgba(6, 182, 212, 0.4)',
-                }
-            },
-        },
-    };
-</script>
-<style>
-    .glass-panel {
-        background: rgba(30, 41, 59, 0.4);
-        backdrop-filter: blur(12px);
-        -webkit-backdrop-filter: blur(12px);
-        border: 1px solid rgba(99, 102, 241, 0.2);
-        box-shadow: 0 8px 32px 0 rgba(0, 0, 0, 0.37);
-    }
-    .btn-3d {
-        background: linear-gradient(135deg, #4f46e5, #06b6d4);
-        box-shadow: 
-            0 4px 6px rgba(0,0,0,0.3),
-            inset 0 1px 0 rgba(255,255,255,0.2),
-            0 0 15px rgba(6, 182, 212, 0.4);
-        border: 1px solid rgba(255,255,255,0.1);
-    }
-    .btn-3d:hover {
-        box-shadow: 
-            0 6px 10px rgba(0,0,0,0.4),
-            inset 0 1px 0 rgba(255,255,255,0.3),
-            0 0 25px rgba(6, 182, 212, 0.6);
-        transform: translateY(-1px);
-    }
-    .btn-3d:disabled {
-        opacity: 0.6;
-        cursor: not-allowed;
-        transform: none;
-    }
-    .loading-spinner {
-        display: inline-block;
-        width: 20px;
-        height: 20px;
-        border: 3px solid rgba(255,255,255,0.3);
-        border-top-color: #fff;
-        border-radius: 50%;
-        animation: spin 0.8s linear infinite;
-    }
-    @keyframes spin { to { transform: rotate(360deg); } }
-    @keyframes popIn { from { transform: scale(0.8); opacity: 0; } to { transform: scale(1); opacity: 1; } }
-    #progressContainer { display: none; }
-    #progressContainer.show { display: block; animation: fadeIn 0.4s ease; }
-    @keyframes fadeIn { from { opacity: 0; transform: translateY(-10px); } to { opacity: 1; transform: translateY(0); } }
-    #downloadBtn { display: none; }
-    #downloadBtn.show { display: flex; animation: popIn 0.5s cubic-bezier(0.34,1.56,0.64,1); }
-    
-    /* Calendar Styles */
-    .calendar-container {
-        background: rgba(15, 23, 42, 0.6);
-        border: 1px solid rgba(99, 102, 241, 0.2);
-        border-radius: 1rem;
-        overflow: hidden;
-    }
-    .calendar-header {
-        display: flex;
-        justify-content: space-between;
-        align-items: center;
-        padding: 1rem;
-        background: rgba(30, 41, 59, 0.4);
-        border-bottom: 1px solid rgba(99, 102, 241, 0.1);
-    }
-    .month-grid {
-        display: grid;
-        grid-template-columns: repeat(4, 1fr);
-        gap: 0.75rem;
-        padding: 1.5rem;
-    }
-    .month-btn {
-        padding: 1rem 0.5rem;
-        text-align: center;
-        border-radius: 0.5rem;
-        cursor: pointer;
-        transition: all 0.2s;
-        border: 1px solid transparent;
-        color: #94a3b8;
-        font-weight: 500;
-        font-size: 0.9rem;
-    }
-    .month-btn:hover {
-        background: rgba(6, 182, 212, 0.1);
-        color: #22d3ee;
-        border-color: rgba(6, 182, 212, 0.2);
-    }
-    .month-btn.selected {
-        background: rgba(6, 182, 212, 0.2);
-        border-color: #06b6d4;
-        color: #fff;
-        box-shadow: 0 0 15px rgba(6, 182, 212, 0.2);
-        font-weight: 700;
-    }
-    .year-btn {
-        padding: 0.5rem;
-        border-radius: 0.5rem;
-        cursor: pointer;
-        color: #94a3b8;
-        transition: all 0.2s;
-    }
-    .year-btn:hover {
-        color: #fff;
-        background: rgba(255, 255, 255, 0.1);
-    }
-</style>
-</head>
-<body class="bg-dark-950 text-gray-200 min-h-screen flex flex-col font-sans transition-colors duration-300 relative overflow-x-hidden selection:bg-cyan-500 selection:text-white">
-
-<!-- Background Effects -->
-<div class="fixed inset-0 z-0 pointer-events-none bg-gradient-dark"></div>
-<div class="fixed inset-0 z-0 pointer-events-none bg-grid-pattern opacity-30"></div>
-<div class="fixed top-0 left-0 w-full h-full z-0 pointer-events-none bg-[radial-gradient(circle_at_50%_0%,rgba(99,102,241,0.15),transparent_50%)]"></div>
-<div class="fixed -top-40 -left-40 w-96 h-96 bg-indigo-500/10 rounded-full blur-[120px] pointer-events-none"></div>
-<div class="fixed bottom-0 right-0 w-[500px] h-[500px] bg-cyan-500/5 rounded-full blur-[120px] pointer-events-none"></div>
-
-<!-- Header -->
-<header class="w-full max-w-7xl mx-auto p-6 z-10 flex items-center justify-between relative">
-    <div class="flex items-center gap-4 group cursor-pointer">
-        <div class="w-12 h-12 rounded-xl bg-gradient-to-br from-indigo-500 to-cyan-400 flex items-center justify-center shadow-lg shadow-cyan-500/20 group-hover:shadow-cyan-500/40 transition-all duration-300 transform group-hover:scale-105 border border-white/10">
-            <span class="material-icons-round text-white text-2xl">directions_car</span>
-        </div>
-        <div>
-            <h1 class="text-xl font-bold font-display tracking-wide text-white leading-tight">FADA Pipeline</h1>
-            <p class="text-[10px] uppercase tracking-[0.2em] text-cyan-400 font-semibold">Vehicle Retail Intelligence</p>
-        </div>
-    </div>
-</header>
-
-<!-- Main Content -->
-<main class="flex-grow flex flex-col items-center justify-center px-4 py-8 z-10 w-full max-w-4xl mx-auto">
-    
-    <!-- Status Badge -->
-    <div class="mb-8 inline-flex items-center gap-2 px-4 py-1.5 rounded-full border border-cyan-500/30 bg-cyan-900/10 backdrop-blur-sm shadow-[0_0_15px_rgba(6,182,212,0.1)]">
-        <span class="w-2 h-2 rounded-full bg-cyan-400 shadow-[0_0_8px_rgba(34,211,238,0.8)] animate-pulse"></span>
-        <span class="text-xs font-semibold tracking-widest text-cyan-300 uppercase">System Operational</span>
-    </div>
-    
-    <!-- Hero Section -->
-    <div class="text-center mb-10 max-w-2xl relative">
-        <h2 class="text-4xl md:text-5xl font-bold text-white mb-4 font-display tracking-tight drop-shadow-lg">
-            FADA <span class="text-cyan-400 inline-block filter drop-shadow-[0_0_10px_rgba(34,211,238,0.5)]">Calendar</span>
-        </h2>
-        <p class="text-base text-slate-400 leading-relaxed font-light">
-            Select a specific month and year to generate the intelligence report.
-        </p>
-    </div>
-    
-    <!-- Glass Panel -->
-    <div class="w-full glass-panel rounded-3xl overflow-hidden relative group transition-all duration-500 hover:shadow-[0_0_40px_rgba(99,102,241,0.15)]">
-        <div class="absolute top-0 left-0 right-0 h-[1px] bg-gradient-to-r from-transparent via-cyan-500/50 to-transparent opacity-70"></div>
-        <div class="absolute bottom-0 left-0 right-0 h-[1px] bg-gradient-to-r from-transparent via-indigo-500/30 to-transparent opacity-30"></div>
-        
-        <div class="p-8 md:p-10 space-y-8">
-            
-            <!-- Calendar Widget -->
-            <div class="max-w-sm mx-auto">
-                <div class="calendar-container shadow-2xl">
-                    <!-- Year Header -->
-                    <div class="calendar-header">
-                        <button onclick="changeYear(-1)" class="year-btn">
-                            <span class="material-icons-round">chevron_left</span>
-                        </button>
-                        <span id="yearDisplay" class="text-xl font-bold text-white tracking-widest font-display">2026</span>
-                        <button onclick="changeYear(1)" class="year-btn">
-                            <span class="material-icons-round">chevron_right</span>
-                        </button>
-                    </div>
-                    
-                    <!-- Month Grid -->
-                    <div id="monthGrid" class="month-grid">
-                        <!-- JS will populate this -->
-                    </div>
-                </div>
-            </div>
-            
-            <!-- Google Sheets Sync Toggle -->
-            <div class="flex justify-center pt-2">
-                <label class="flex items-center gap-3 cursor-pointer group">
-                    <div class="relative">
-                        <input type="checkbox" id="syncToSheets" checked class="sr-only peer">
-                        <div class="w-11 h-6 bg-slate-700 rounded-full peer peer-checked:bg-cyan-600 transition-colors"></div>
-                        <div class="absolute left-1 top-1 w-4 h-4 bg-white rounded-full transition-transform peer-checked:translate-x-5"></div>
-                    </div>
-                    <span class="text-sm text-slate-300 group-hover:text-cyan-300 transition-colors flex items-center gap-2">
-                        <span class="material-icons-round text-lg">cloud_upload</span>
-                        Sync to Google Sheets
-                    </span>
-                </label>
-            </div>
-            
-            <!-- Google Sheet Link (Always Visible if Configured) -->
-            {% if google_sheet_url %}
-            <div class="flex justify-center -mt-2">
-                <a href="{{ google_sheet_url }}" target="_blank" class="text-xs text-cyan-400 hover:text-cyan-300 flex items-center gap-1 transition-colors border-b border-dashed border-cyan-500/30 hover:border-cyan-300 pb-0.5">
-                    <span class="material-icons-round text-sm">open_in_new</span>
-                    Open Linked Google Sheet
-                </a>
-            </div>
-            {% endif %}
-            
-            <!-- Generate Button -->
-            <div class="pt-4 flex justify-center">
-                <button id="runBtn" onclick="runPipeline()" class="relative group overflow-hidden rounded-xl btn-3d text-white font-bold text-lg py-4 px-10 transition-all duration-300 active:scale-[0.98] min-w-[250px]">
-                    <div class="absolute inset-0 bg-white/20 translate-y-full group-hover:translate-y-0 transition-transform duration-300 ease-out skew-y-12"></div>
-                    <div id="btnContent" class="relative flex items-center justify-center gap-3">
-                        <span class="material-icons-round text-2xl">rocket_launch</span>
-                        <span>GENERATE REPORT</span>
-                    </div>
-                </button>
-            </div>
-            
-            <!-- Status Display -->
-            <div id="status" class="text-center p-3 text-slate-300 bg-slate-900/30 rounded-xl min-h-[50px] flex items-center justify-center text-sm"></div>
-            
-            <!-- Progress Container -->
-            <div id="progressContainer" class="bg-slate-900/50 rounded-xl p-6 border border-slate-700/50">
-                <div class="grid grid-cols-3 gap-4 mb-4">
-                    <div class="text-center p-3 bg-slate-800/50 rounded-lg border border-slate-700/30">
-                        <div class="text-xl mb-1">📥</div>
-                        <div id="downloadedCount" class="text-xl font-bold text-cyan-400">0</div>
-                        <div class="text-[10px] text-slate-500 uppercase tracking-wider">Downloaded</div>
-                    </div>
-                    <div class="text-center p-3 bg-slate-800/50 rounded-lg border border-slate-700/30">
-                        <div class="text-xl mb-1">📄</div>
-                        <div id="processedCount" class="text-xl font-bold text-cyan-400">0</div>
-                        <div class="text-[10px] text-slate-500 uppercase tracking-wider">Processed</div>
-                    </div>
-                    <div class="text-center p-3 bg-slate-800/50 rounded-lg border border-slate-700/30">
-                        <div class="text-xl mb-1">⏱️</div>
-                        <div id="etaCount" class="text-xl font-bold text-cyan-400">--</div>
-                        <div class="text-[10px] text-slate-500 uppercase tracking-wider">ETA</div>
-                    </div>
-                </div>
-                <div class="bg-slate-800/50 h-6 rounded-full overflow-hidden shadow-inner">
-                    <div id="progressBar" class="h-full bg-gradient-to-r from-indigo-500 via-cyan-500 to-emerald-500 transition-all duration-400 flex items-center justify-center text-white font-bold text-xs" style="width: 0%">0%</div>
-                </div>
-            </div>
-            
-            <!-- Download Button -->
-            <div class="flex justify-center">
-                <button id="downloadBtn" onclick="downloadFile()" class="items-center gap-3 py-3 px-6 bg-gradient-to-r from-emerald-600 to-cyan-600 hover:from-emerald-500 hover:to-cyan-500 text-white font-bold rounded-xl shadow-lg shadow-emerald-500/20 hover:shadow-emerald-500/40 transition-all duration-300">
-                    <span class="material-icons-round">download</span>
-                    <span>Download Master Excel</span>
-                </button>
-            </div>
-        </div>
-    </div>
-    
-    <!-- Footer -->
-    <footer class="mt-8 text-center text-xs text-slate-600 pb-6">
-        <p>© 2025 FADA Data Intelligence Unit. All rights reserved.</p>
-    </footer>
-</main>
-
-<script>
-// ============== CALENDAR STATE MANAGEMENT ==============
-let currentYear = new Date().getFullYear();
-let selectedYear = currentYear;
-let selectedMonth = new Date().getMonth() + 1; // 1-12
-let eventSource = null;
-let currentSessionId = null;
-
-// Initialize
-renderCalendar();
-
-function renderCalendar() {
-    // Update year display
-    document.getElementById('yearDisplay').textContent = selectedYear;
-    
-    // Generate grid
-    const months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'];
-    const grid = document.getElementById('monthGrid');
-    grid.innerHTML = '';
-    
-    months.forEach((m, index) => {
-        const monthNum = index + 1;
-        const btn = document.createElement('div');
-        btn.className = `month-btn ${monthNum === selectedMonth ? 'selected' : ''}`;
-        btn.textContent = m;
-        btn.onclick = () => selectMonth(monthNum);
-        grid.appendChild(btn);
-    });
-}
-
-function changeYear(delta) {
-    selectedYear += delta;
-    renderCalendar();
-}
-
-function selectMonth(m) {
-    selectedMonth = m;
-    renderCalendar();
-}
-
-// ============== PIPELINE EXECUTION ==============
-function runPipeline() {
-    // Disable button
-    const btn = document.getElementById('runBtn');
-    btn.disabled = true;
-    document.getElementById('btnContent').innerHTML = '<div class="loading-spinner"></div><span>Processing...</span>';
-    
-    // Show progress
-    const monthName = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'][selectedMonth - 1];
-    document.getElementById('status').innerHTML = `<div class="loading-spinner"></div> Initializing for ${monthName} ${selectedYear}...`;
-    document.getElementById('progressContainer').classList.add('show');
-    document.getElementById('downloadBtn').classList.remove('show');
-    
-    // Reset counters
-    document.getElementById('downloadedCount').textContent = '0';
-    document.getElementById('processedCount').textContent = '0';
-    document.getElementById('etaCount').textContent = '--';
-    document.getElementById('progressBar').style.width = '0%';
-    document.getElementById('progressBar').textContent = '0%';
-    
-    // Close existing event source
-    if (eventSource) {
-        eventSource.close();
-    }
-    
-    // Start SSE connection
-    const syncToSheets = document.getElementById('syncToSheets').checked;
-    const url = `/stream?month=${selectedMonth}&year=${selectedYear}&sync=${syncToSheets}`;
-    eventSource = new EventSource(url);
-    
-    eventSource.onmessage = function(event) {
-        const parts = event.data.split('|');
-        const type = parts[0];
-        
-        if (type === 'STATUS') {
-            document.getElementById('status').innerHTML = parts[1];
-        } else if (type === 'PROGRESS') {
-            const downloaded = parseInt(parts[2]) || 0;
-            const processed = parseInt(parts[3]) || 0;
-            const total = parseInt(parts[4]) || 1;
-            const eta = parts[5] || '--';
-            
-            document.getElementById('downloadedCount').textContent = downloaded;
-            document.getElementById('processedCount').textContent = processed;
-            document.getElementById('etaCount').textContent = eta;
-            
-            const progress = Math.round(((downloaded + processed) / (total * 2)) * 100);
-            document.getElementById('progressBar').style.width = progress + '%';
-            document.getElementById('progressBar').textContent = progress + '%';
-        } else if (type === 'COMPLETE') {
-            currentSessionId = parts[1];
-            document.getElementById('status').innerHTML = '🎉 <strong>Pipeline Complete!</strong> Your master Excel file is ready.';
-            document.getElementById('downloadBtn').classList.add('show');
-            document.getElementById('progressBar').style.width = '100%';
-            document.getElementById('progressBar').textContent = '100%';
-            
-            resetButton();
-            eventSource.close();
-        } else if (type === 'ERROR') {
-            document.getElementById('status').innerHTML = '❌ Error: ' + parts[1];
-            resetButton();
-            eventSource.close();
-        }
-    };
-    
-    eventSource.onerror = function() {
-        document.getElementById('status').innerHTML = '❌ Connection error. Please try again.';
-        resetButton();
-        eventSource.close();
-    };
-}
+# Store active sessions (LRU order: oldest first). Bounded by _evict_sessions
+# so day-long deployments don't accumulate stale entries and report files.
+active_sessions = OrderedDict()
+_sessions_lock = threading.Lock()
+_SESSION_TTL = int(os.environ.get('FADA_SESSION_TTL', 3600))  # seconds
+_MAX_SESSIONS = int(os.environ.get('FADA_MAX_SESSIONS', 100))
+_SESSIONS_FILE = OUTPUT_DIR / '.sessions.json'
+OUTPUT_DIR_STR = str(OUTPUT_DIR)  # stringified once for /status
+
+
+def _save_sessions(unlink_candidates=()) -> None:
+    """Merge active_sessions into the shared on-disk session file.
+
+    Caller must hold _sessions_lock. Each gunicorn worker holds its own
+    in-memory map, so a plain truncate-rewrite would be last-writer-wins:
+    one worker's first save erases every session its siblings persisted,
+    404ing those downloads after a recycle. Under an exclusive flock on a
+    sidecar .lock file, the current on-disk state is re-read, this
+    worker's sessions are layered on top, expired and over-limit entries
+    are dropped, and the result is published with an atomic rename (same
+    pattern as ProcessingCache.save).
+
+    unlink_candidates are report files of locally evicted sessions; each
+    is deleted only if no surviving session in the merged cross-worker
+    state still references it, so one worker's eviction cannot 404 a
+    download another worker is still serving.
+    """
+    cutoff = time.time() - _SESSION_TTL
+    stale_files = set(unlink_candidates)
+    lock_path = _SESSIONS_FILE.with_suffix('.lock')
+    try:
+        with open(lock_path, 'w') as lock_f:
+            if fcntl is not None:
+                fcntl.flock(lock_f, fcntl.LOCK_EX)
+            try:
+                try:
+                    with open(_SESSIONS_FILE) as f:
+                        merged = json.load(f)
+                except (OSError, ValueError):
+                    merged = {}
+                merged.update(active_sessions)
+                # Oldest-first so the over-limit trim below drops the
+                # oldest survivors, mirroring _evict_sessions
+                survivors = OrderedDict(sorted(
+                    ((sid, info) for sid, info in merged.items()
+                     if info.get('timestamp', 0) >= cutoff),
+                    key=lambda kv: kv[1].get('timestamp', 0)
+                ))
+                while len(survivors) > _MAX_SESSIONS:
+                    _, dropped = survivors.popitem(last=False)
+                    stale_files.add(dropped.get('file', ''))
+                tmp_path = _SESSIONS_FILE.with_name(
+                    f'{_SESSIONS_FILE.name}.{os.getpid()}.tmp'
+                )
+                with open(tmp_path, 'w') as f:
+                    json.dump(survivors, f)
+                os.replace(tmp_path, _SESSIONS_FILE)
+                live_files = {info.get('file') for info in survivors.values()}
+                for stale in stale_files - live_files - {''}:
+                    try:
+                        Path(stale).unlink(missing_ok=True)
+                    except OSError as e:
+                        logger.warning(f"Could not remove expired report {stale}: {e}")
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_f, fcntl.LOCK_UN)
+    except OSError as e:
+        logger.warning(f"Could not persist sessions: {e}")
+
+
+def _load_sessions() -> None:
+    """Merge sessions persisted by a previous process into memory.
+
+    Worker restarts otherwise 404 every /download for runs completed
+    before the recycle. Entries whose report file vanished are skipped.
+    """
+    try:
+        with open(_SESSIONS_FILE) as f:
+            saved = json.load(f)
+    except (OSError, ValueError):
+        return
+    with _sessions_lock:
+        # Newest-first iteration + move-to-front leaves the oldest entry at
+        # the head, preserving the eviction order
+        for session_id, info in sorted(saved.items(),
+                                       key=lambda kv: kv[1].get('timestamp', 0),
+                                       reverse=True):
+            if session_id not in active_sessions and Path(info.get('file', '')).exists():
+                active_sessions[session_id] = info
+                active_sessions.move_to_end(session_id, last=False)
+        evicted = _evict_sessions()
+        if evicted:
+            _save_sessions(evicted)
+
+
+def _evict_sessions() -> list:
+    """Drop expired / over-limit sessions from this worker's map.
+
+    Caller must hold _sessions_lock. Returns the report files of evicted
+    sessions that no locally surviving session references — builds for the
+    same period reuse the same deterministic filename. Actually unlinking
+    is deferred to _save_sessions, which also checks the merged on-disk
+    state: a sibling worker may hold a live session for the same file.
+    """
+    cutoff = time.time() - _SESSION_TTL
+    evicted_files = []
+    while active_sessions:
+        oldest_id, oldest = next(iter(active_sessions.items()))
+        if oldest['timestamp'] >= cutoff and len(active_sessions) <= _MAX_SESSIONS:
+            break
+        del active_sessions[oldest_id]
+        if not any(s['file'] == oldest['file'] for s in active_sessions.values()):
+            evicted_files.append(oldest['file'])
+    return evicted_files
+
+
+def _register_session(session_id: str, info: dict) -> None:
+    """Record a completed run's output, evicting stale sessions first."""
+    with _sessions_lock:
+        active_sessions[session_id] = info
+        active_sessions.move_to_end(session_id)
+        _save_sessions(_evict_sessions())
+
+
+def _session_sweeper() -> None:
+    """Periodically evict expired sessions and their report files.
+
+    Eviction otherwise only happens when a new run registers, so an idle
+    deployment would hold its last reports (and disk space) indefinitely.
+    """
+    while True:
+        time.sleep(_SWEEP_INTERVAL)
+        with _sessions_lock:
+            before = len(active_sessions)
+            evicted = _evict_sessions()
+            if evicted or len(active_sessions) != before:
+                _save_sessions(evicted)
+
+
+_SWEEP_INTERVAL = int(os.environ.get('FADA_SWEEP_INTERVAL', 300))  # seconds
+threading.Thread(target=_session_sweeper, name='session-sweeper',
+                 daemon=True).start()
+
+
+class ProgressChannel:
+    """Lightweight progress channel between the pipeline and the SSE stream.
+
+    Uses a deque (append/popleft are atomic under the CPython GIL) plus a
+    single threading.Event for consumer wake-ups, instead of queue.Queue
+    whose internal mutex and condition variables are acquired on every
+    put/get - significant overhead when progress messages arrive per PDF.
+    """
+
+    # Upper bound on buffered messages. A stalled consumer sheds the oldest
+    # entries, which coalescing would discard anyway; terminal messages
+    # (COMPLETE/ERROR/sentinel) are the newest so they always survive.
+    MAXLEN = 256
+
+    def __init__(self):
+        self._messages = deque(maxlen=self.MAXLEN)
+        self._event = threading.Event()
+        self._put_lock = threading.Lock()
+
+    @staticmethod
+    def _is_progress(item) -> bool:
+        return isinstance(item, tuple) and item[1].startswith('PROGRESS|')
+
+    def put(self, message):
+        """Append a message and wake the consumer.
+
+        The lock serializes producers (the runner thread and a late
+        subscriber's replay can put concurrently); the consumer stays
+        lock-free, so the in-place coalesce below can still lose a race
+        against drain()'s popleft - the IndexError fallback turns that
+        into a plain append instead of crashing the runner.
+        """
+        with self._put_lock:
+            # Latest-progress-wins at the producer: a PROGRESS frame behind
+            # another pending PROGRESS frame supersedes it in place, so a
+            # stalled consumer buffers one progress state instead of letting
+            # a burst of them push STATUS frames out of the bounded deque.
+            if self._is_progress(message) and self._messages:
+                try:
+                    if self._is_progress(self._messages[-1]):
+                        self._messages[-1] = message
+                        return
+                except IndexError:
+                    pass  # drain() emptied the deque mid-check
+            self._messages.append(message)
+            # Unconditional set(): gating it on a was-empty check races with
+            # drain() emptying the deque and can hold a terminal frame back
+            # for a full drain timeout.
+            self._event.set()
+
+    def drain(self, timeout: float = 0.5) -> list:
+        """Wait for messages, then return all pending.
+
+        timeout=None blocks until at least one message arrives; 0 returns
+        whatever is pending without waiting.
+        """
+        # Skip the wait if messages are already pending - with 0 -> 1
+        # signalling, a message appended just after a drain emptied the
+        # deque may not have set the event
+        if not self._messages:
+            self._event.wait(timeout)
+        self._event.clear()
+        messages = []
+        while self._messages:
+            messages.append(self._messages.popleft())
+        return messages
+
+    def __len__(self):
+        return len(self._messages)
+
+
+# ============== DASHBOARD TEMPLATE (api/templates/dashboard.html) ==============
+
+
+# The template's only dynamic value (the Google Sheet URL) comes from config,
+# so render it once at import time instead of invoking the Jinja parser and
+# compiler on every GET /
+_spreadsheet_id = GOOGLE_SHEETS_CONFIG.get('spreadsheet_id')
+_google_sheet_url = f"https://docs.google.com/spreadsheets/d/{_spreadsheet_id}" if _spreadsheet_id else None
+
+with app.app_context():
+    _DASHBOARD_BYTES = render_template(
+        'dashboard.html', google_sheet_url=_google_sheet_url
+    ).encode('utf-8')
+_DASHBOARD_ETAG = hashlib.md5(_DASHBOARD_BYTES).hexdigest()
+
+# Precompress once at import - the HTML is mostly repetitive markup and
+# compresses ~7x, and this avoids per-request compression CPU entirely
+_DASHBOARD_GZIP = gzip.compress(_DASHBOARD_BYTES, compresslevel=9)
+try:
+    import brotli
+    _DASHBOARD_BROTLI = brotli.compress(_DASHBOARD_BYTES, quality=11)
+except ImportError:
+    _DASHBOARD_BROTLI = None
+
+
+# Memoized filter/dedup results, keyed by the links-cache version so a
+# fresh scrape invalidates every entry
+_filter_cache = {}
+_filter_lock = threading.Lock()
+
+
+def _filtered_unique_links(pdf_links: list, links_version: int,
+                           max_month: int, max_year: int) -> list:
+    """Filter links up to (max_month, max_year) and deduplicate by URL.
+
+    Results are memoized per (links version, month, year) so repeat runs
+    with overlapping selections skip the refilter entirely. links_version
+    must be the version returned alongside the pdf_links snapshot - a
+    fresh links_cache_version() read here could belong to a newer scrape
+    and file a result computed from the old snapshot under it.
+    """
+    key = (links_version, max_month, max_year)
+
+    with _filter_lock:
+        cached = _filter_cache.get(key)
+    if cached is not None:
+        return cached
+
+    # Use filter_by_date_range to get ALL PDFs from beginning up to selected
+    # period. Using 2016 as earliest year (FADA data availability start)
+    all_filtered_links = filter_by_date_range(
+        pdf_links,
+        start_month=1, start_year=2016,
+        end_month=max_month, end_year=max_year
+    )
+
+    # Remove duplicates (if any) in a single pass, keeping first occurrence
+    seen_urls = set()
+    unique_links = []
+    for link in all_filtered_links:
+        url = link['url']
+        if url not in seen_urls:
+            seen_urls.add(url)
+            unique_links.append(link)
+    # The filtered superset is dead weight once deduplicated
+    del all_filtered_links
+
+    with _filter_lock:
+        # Drop entries computed against an older link list
+        for stale in [k for k in _filter_cache if k[0] != key[0]]:
+            del _filter_cache[stale]
+        _filter_cache[key] = unique_links
+
+    return unique_links
+
+
+# Progress channels for in-flight runs, keyed by session id. Each run gets
+# its own channel so concurrent pipelines never interleave messages;
+# entries are removed when the stream ends.
+job_channels = {}
+_job_channels_lock = threading.Lock()
+
+
+class _BroadcastChannel:
+    """Fans one runner's progress out to every subscribed ProgressChannel.
+
+    Exposes the same put() the runner already calls, so PipelineRunner.run
+    is oblivious to how many dashboards are watching. Messages are kept in
+    a bounded history and replayed to late subscribers, so a viewer who
+    joins mid-run (or just after completion) still sees the terminal
+    COMPLETE/ERROR frame.
+    """
+
+    def __init__(self):
+        self._subscribers = []
+        self._history = deque(maxlen=ProgressChannel.MAXLEN)
+        self._lock = threading.Lock()
+        self._next_id = 0
+        self.runner = None  # set by the owning stream for cancellation
+
+    def subscribe(self, last_id: int = -1) -> ProgressChannel:
+        """Attach a new consumer, replaying what it missed.
+
+        A reconnecting EventSource passes its Last-Event-ID as last_id so
+        only events it has not yet seen are replayed.
+        """
+        channel = ProgressChannel()
+        with self._lock:
+            for item in self._history:
+                if item is None or item[0] > last_id:
+                    channel.put(item)
+            self._subscribers.append(channel)
+        return channel
+
+    def unsubscribe(self, channel: ProgressChannel) -> None:
+        """Detach a consumer; cancel the run once nobody is watching.
+
+        Without this, a browser that disconnects mid-pipeline leaves the
+        runner producing into the void until it finishes on its own.
+        """
+        with self._lock:
+            try:
+                self._subscribers.remove(channel)
+            except ValueError:
+                return
+            remaining = len(self._subscribers)
+        if remaining == 0 and self.runner is not None:
+            self.runner.cancelled.set()
+
+    def put(self, message) -> None:
+        """Tag the message with a monotonic event id and fan it out.
+
+        The None sentinel passes through untagged - it terminates streams
+        and never reaches the wire.
+        """
+        with self._lock:
+            if message is not None:
+                message = (self._next_id, message)
+                self._next_id += 1
+            self._history.append(message)
+            for channel in self._subscribers:
+                channel.put(message)
+
+
+# In-flight run registry: concurrent /stream requests for the same
+# selection attach to the one running pipeline instead of kicking off
+# duplicate scrapes, extractions and Sheets syncs.
+_inflight = {}
+_inflight_lock = threading.Lock()
+
+
+# Long-lived process pool for CPU-bound PDF extraction. Created lazily so
+# workers that never run a pipeline don't fork children; reused across runs
+# to avoid paying pool startup per request. Small VMs can cap the fan-out
+# below their core count via FADA_EXTRACT_WORKERS.
+_process_pool = None
+_process_pool_lock = threading.Lock()
+_EXTRACT_WORKERS = int(os.environ.get('FADA_EXTRACT_WORKERS', os.cpu_count() or 1))
+
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    """Get the shared extraction pool, creating it on first use."""
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is None:
+            _process_pool = ProcessPoolExecutor(max_workers=_EXTRACT_WORKERS)
+        return _process_pool
+
+
+def _reset_process_pool() -> None:
+    """Discard a broken pool so the next run gets a fresh one."""
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is not None:
+            _process_pool.shutdown(wait=False, cancel_futures=True)
+            _process_pool = None
+
+
+@atexit.register
+def _shutdown_process_pool():
+    with _process_pool_lock:
+        if _process_pool is not None:
+            _process_pool.shutdown(wait=False, cancel_futures=True)
 
-function resetButton() {
-    const btn = document.getElementById('runBtn');
-    btn.disabled = false;
-    document.getElementById('btnContent').innerHTML = '<span class="material-icons-round text-2xl">rocket_launch</span><span>GENERATE REPORT</span>';
-}
 
-function downloadFile() {
-    if (currentSessionId) {
-        window.location.href = '/download?session=' + currentSessionId;
-    }
-}
-</script>
+# Completed-build cache: {(sorted months, sorted years): (path, latest_period, ts)}.
+# Repeat requests for the same selection within the TTL reuse the existing
+# master file instead of re-running the whole pipeline.
+_build_cache = {}
+_build_lock = threading.Lock()
+_BUILD_TTL = 600  # seconds
 
-</body></html>'''
+# Sheets upload tuning: rows per values.update call, and how many times a
+# rate-limited (429/503) chunk is retried with exponential backoff
+_SHEETS_CHUNK_ROWS = 10000
+_SHEETS_MAX_RETRIES = 5
+
+# Invariant prefixes of the per-file progress messages, hoisted out of the
+# per-PDF callbacks so only the mutable tail is formatted each time
+_DL_PREFIX = "PROGRESS|download|"
+_PROC_PREFIX = "PROGRESS|process|"
+
+# Seconds between SSE keep-alive comments during quiet pipeline stretches.
+# Proxies (nginx, Cloudflare) reap idle long-lived connections after
+# ~30-60s; a comment frame every 15s keeps them warm without producing
+# user-visible events.
+_SSE_KEEPALIVE = float(os.environ.get('FADA_SSE_KEEPALIVE', 15))
+
+# Bounded executor for background Sheets syncs. At most two uploads run at
+# once (a burst of runs queues instead of stacking threads), workers carry a
+# recognizable name in thread dumps, and each sync yields a Future so
+# failures surface through a done callback instead of dying silently in a
+# raw thread.
+_sheets_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='sheets-sync')
+
+
+def _log_sync_outcome(future):
+    """Done callback for Sheets sync futures - surface swallowed errors."""
+    exc = future.exception()
+    if exc is not None:
+        logger.error(f"Google Sheets sync task failed: {exc}")
+
+
+@atexit.register
+def _shutdown_sheets_pool():
+    _sheets_pool.shutdown(wait=False, cancel_futures=True)
+
+
+# Shared executor for pipeline runs. Each /stream connection used to spawn
+# a fresh OS thread; the pool reuses workers and caps how many pipelines
+# can run at once - extra requests queue instead of piling up threads.
+PIPELINE_POOL = ThreadPoolExecutor(
+    max_workers=int(os.environ.get('FADA_WORKERS', 4)),
+    thread_name_prefix='pipeline'
+)
+
+
+@atexit.register
+def _shutdown_pipeline_pool():
+    PIPELINE_POOL.shutdown(wait=False, cancel_futures=True)
 
 
 # ============== PIPELINE ORCHESTRATOR ==============
@@ -473,39 +545,57 @@ class PipelineRunner:
     UPDATED: Now supports multiple months and years for full timeline processing.
     """
     
-    def __init__(self, months: list, years: list, session_id: str, sync_to_sheets: bool = True):
-        self.months = months  # List of months to process
-        self.years = years    # List of years to process
+    def __init__(self, months, years, session_id: str, sync_to_sheets: bool = True):
+        # Stored as tuples: the run never mutates its period selection, and
+        # tuples are directly usable as cache keys
+        self.months = tuple(months)  # Months to process
+        self.years = tuple(years)    # Years to process
         self.session_id = session_id
         self.sync_to_sheets = sync_to_sheets  # Whether to sync to Google Sheets
         self.output_file = None
+        # Set when every SSE viewer has disconnected; checked between steps
+        self.cancelled = threading.Event()
     
-    def run(self, progress_queue: queue.Queue):
+    def run(self, progress_queue: ProgressChannel):
         """Run the complete pipeline for all selected month/year combinations.
         
         UPDATED: Now fetches all data UP TO selected period and outputs only latest period.
         """
         try:
+            # Step 0: Reuse a recent identical build if one exists - the
+            # master file is deterministic for a given period selection
+            build_key = (tuple(sorted(self.months)), tuple(sorted(self.years)))
+            with _build_lock:
+                cached = _build_cache.get(build_key)
+            if cached:
+                cached_path, cached_latest, cached_ts = cached
+                if time.time() - cached_ts < _BUILD_TTL and cached_path.exists():
+                    self.output_file = cached_path
+                    _register_session(self.session_id, {
+                        'file': str(cached_path),
+                        'months': self.months,
+                        'years': self.years,
+                        'latest_period': cached_latest,
+                        'timestamp': time.time()
+                    })
+                    progress_queue.put("STATUS|⚡ Reusing master Excel built moments ago for this selection")
+                    progress_queue.put(f"COMPLETE|{self.session_id}")
+                    return
+
             # Step 1: Fetch PDF links
             progress_queue.put(f"STATUS|📡 Fetching PDF links from FADA website...")
-            pdf_links = fetch_pdf_links()
+            pdf_links, links_version = fetch_pdf_links_cached(with_version=True)
             
             # NEW LOGIC: Determine the max selected period (end boundary)
             max_year = max(self.years)
             # Find the max month for the max year (or just use max month if single year)
             max_month = max(self.months)
             
-            # Use filter_by_date_range to get ALL PDFs from beginning up to selected period
-            # Using 2016 as earliest year (FADA data availability start)
-            all_filtered_links = filter_by_date_range(
-                pdf_links,
-                start_month=1, start_year=2016,
-                end_month=max_month, end_year=max_year
-            )
-            
-            # Remove duplicates (if any)
-            unique_links = list({link['url']: link for link in all_filtered_links}.values())
-            
+            # Filter to all PDFs up to the selected period (memoized per
+            # links-cache version)
+            unique_links = _filtered_unique_links(pdf_links, links_version,
+                                                  max_month, max_year)
+
             if not unique_links:
                 progress_queue.put(f"ERROR|No PDFs found up to {max_month}/{max_year}")
                 return
@@ -517,6 +607,10 @@ class PipelineRunner:
                 progress_queue.put(f"ERROR|Could not determine latest available period")
                 return
             
+            if self.cancelled.is_set():
+                logger.info(f"Pipeline {self.session_id} cancelled - no viewers left")
+                return
+
             total_files = len(unique_links)
             progress_queue.put(f"STATUS|📥 Found {total_files} PDFs up to {max_month}/{max_year}. Latest available: {latest_month}/{latest_year}. Downloading...")
             
@@ -526,244 +620,521 @@ class PipelineRunner:
                 nonlocal downloaded
                 if success:
                     downloaded = completed
-                progress_queue.put(f"PROGRESS|download|{completed}|0|{total}|{eta}s")
+                progress_queue.put(_DL_PREFIX + f"{completed}|0|{total}|{eta}s")
             
             download_result = download_pdfs(unique_links, progress_callback=download_progress)
             
+            if self.cancelled.is_set():
+                logger.info(f"Pipeline {self.session_id} cancelled - no viewers left")
+                return
+
             progress_queue.put(f"STATUS|📄 Processing {downloaded} PDFs...")
             
             # Step 3: Extract tables from PDFs for all available months/years
-            # Process all periods that were downloaded
+            # Collect the distinct periods that were downloaded
             all_excel_files = []
-            processed_periods = set()
-            for link in unique_links:
-                link_month = link.get('month')
-                link_year = link.get('year')
-                if link_month and link_year:
-                    period_key = (link_month, link_year)
-                    if period_key not in processed_periods:
-                        processed_periods.add(period_key)
-                        excel_files = process_all_pdfs(month=link_month, year=link_year)
-                        all_excel_files.extend(excel_files)
-            
+            processed_periods = {
+                (link['month'], link['year'])
+                for link in unique_links
+                if link.get('month') and link.get('year')
+            }
+
+            # PDF table extraction is CPU-bound (pdfplumber parsing), so fan
+            # the independent periods out over the shared process pool
+            # instead of looping sequentially on a single core. A broken
+            # pool (killed child) is rebuilt once and the batch retried -
+            # the extractor's cache makes the redo cheap.
+            for attempt in range(2):
+                if not processed_periods:
+                    break
+                all_excel_files = []
+                try:
+                    executor = _get_process_pool()
+                    futures = {
+                        executor.submit(process_all_pdfs, month=m, year=y): (m, y)
+                        for m, y in processed_periods
+                    }
+                    for future in as_completed(futures):
+                        try:
+                            all_excel_files.extend(future.result())
+                        except BrokenProcessPool:
+                            raise
+                        except Exception as e:
+                            period = futures[future]
+                            logger.error(f"Extraction failed for period {period}: {e}")
+                        progress_queue.put(_PROC_PREFIX + f"{downloaded}|{len(all_excel_files)}|{total_files}|--")
+                    break
+                except BrokenProcessPool:
+                    logger.error("Extraction process pool broke; restarting it")
+                    _reset_process_pool()
+                    if attempt == 1:
+                        raise
+
+            if self.cancelled.is_set():
+                logger.info(f"Pipeline {self.session_id} cancelled - no viewers left")
+                return
+
             processed = len(all_excel_files)
-            progress_queue.put(f"PROGRESS|process|{downloaded}|{processed}|{total_files}|--")
+            progress_queue.put(_PROC_PREFIX + f"{downloaded}|{processed}|{total_files}|--")
             progress_queue.put(f"STATUS|📊 Building master Excel with all data up to {latest_month}/{latest_year}...")
             
-            # Step 4: Build consolidated master Excel with all data up to selected period
-            self.output_file = build_consolidated_master(
-                months=self.months,
-                years=self.years
-            )
+            # Step 4: Build consolidated master Excel with all data up to selected period.
+            # When a Sheets sync will follow, grab the sheet matrix straight
+            # from the in-memory workbook so the sync does not have to reload
+            # the file it just wrote.
+            want_matrix = self.sync_to_sheets and GOOGLE_SHEETS_CONFIG.get('enabled', False)
+            if want_matrix:
+                self.output_file, master_matrix = build_consolidated_master(
+                    months=self.months,
+                    years=self.years,
+                    return_matrix=True,
+                    use_write_only=True
+                )
+            else:
+                master_matrix = None
+                self.output_file = build_consolidated_master(
+                    months=self.months,
+                    years=self.years,
+                    use_write_only=True
+                )
             
             if self.output_file:
                 # Store session info
-                active_sessions[self.session_id] = {
+                _register_session(self.session_id, {
                     'file': str(self.output_file),
                     'months': self.months,
                     'years': self.years,
                     'latest_period': (latest_month, latest_year),
                     'timestamp': time.time()
-                }
+                })
+                with _build_lock:
+                    _build_cache[build_key] = (Path(self.output_file),
+                                               (latest_month, latest_year),
+                                               time.time())
                 
-                # Step 5: Sync to Google Sheets (if enabled)
+                # Step 5: Sync to Google Sheets (if enabled). The download
+                # file is already on disk, so the upload happens in a daemon
+                # thread - the UI gets COMPLETE immediately instead of
+                # waiting out a potentially minutes-long Sheets write.
                 if self.sync_to_sheets and GOOGLE_SHEETS_CONFIG.get('enabled', False):
-                    progress_queue.put(f"STATUS|☁️ Syncing to Google Sheets...")
-                    try:
-                        import pandas as pd
-                        import gspread
-                        from google.oauth2.service_account import Credentials
-                        
-                        # Read the entire Excel file as a raw matrix (no dict conversion)
-                        excel_df = pd.read_excel(self.output_file, sheet_name='Master Data', header=None)
-                        
-                        # Convert to list of lists, replacing NaN with empty string
-                        # This preserves EXACT structure of Excel
-                        data_matrix = excel_df.fillna('').values.tolist()
-                        
-                        # Convert all values to strings for Sheets API
-                        for i, row in enumerate(data_matrix):
-                            data_matrix[i] = [str(val) if val != '' else '' for val in row]
-                        
-                        # === NEW LOGIC: Duplicate Column C (index 2) ===
-                        if len(data_matrix) > 0 and len(data_matrix[0]) >= 3:
-                            # We need to duplicate the 3rd column (index 2) twice at the beginning
-                            # This means prepending it to each row
-                            
-                            # Note: Logic was requested as "add the two column in the begining and then pouplate the data from C column"
-                            # I will interpret this as inserting two new columns at index 0 and 1, both having values from the original index 2.
-                            
-                            for row in data_matrix:
-                                # Original Column C value (index 2)
-                                col_c_val = row[2]
-                                # Insert at 0 (becomes new A) and then again (becomes new B)
-                                # Actually, inserting at 0 shifts everything.
-                                # So: Insert at 0. Then insert at 0 again.
-                                row.insert(0, col_c_val)
-                                row.insert(0, col_c_val)
-
-                        
-                        logger.info(f"Google Sheets: Syncing {len(data_matrix)} rows × {len(data_matrix[0])} columns")
-                        progress_queue.put(f"STATUS|☁️ Preparing {len(data_matrix)} rows × {len(data_matrix[0])} columns...")
-                        
-                        # Connect to Google Sheets
-                        SCOPES = ['https://www.googleapis.com/auth/spreadsheets', 'https://www.googleapis.com/auth/drive']
-                        credentials = Credentials.from_service_account_file(
-                            GOOGLE_SHEETS_CONFIG['credentials_file'],
-                            scopes=SCOPES
-                        )
-                        client = gspread.authorize(credentials)
-                        spreadsheet = client.open_by_key(GOOGLE_SHEETS_CONFIG['spreadsheet_id'])
-                        
-                        # Get or create worksheet
-                        worksheet_name = GOOGLE_SHEETS_CONFIG['worksheet_name']
-                        try:
-                            worksheet = spreadsheet.worksheet(worksheet_name)
-                            # Clear existing data
-                            worksheet.clear()
-                            progress_queue.put(f"STATUS|☁️ Cleared existing worksheet, writing fresh data...")
-                        except gspread.WorksheetNotFound:
-                            worksheet = spreadsheet.add_worksheet(
-                                title=worksheet_name,
-                                rows=max(len(data_matrix) + 10, 1000),
-                                cols=max(len(data_matrix[0]) + 5, 100)
-                            )
-                            progress_queue.put(f"STATUS|☁️ Created new worksheet: {worksheet_name}")
-                        
-                        # Resize worksheet if needed
-                        if worksheet.row_count < len(data_matrix) or worksheet.col_count < len(data_matrix[0]):
-                            worksheet.resize(rows=len(data_matrix) + 10, cols=len(data_matrix[0]) + 5)
-                        
-                        # Write entire matrix in one batch (exact Excel replication)
-                        progress_queue.put(f"STATUS|☁️ Writing {len(data_matrix)} rows to Google Sheets...")
-                        worksheet.update('A1', data_matrix, value_input_option='RAW')
-                        
-                        # Format header row (row 2 = index 1) as bold
-                        worksheet.format('2:2', {'textFormat': {'bold': True}})
-                        
-                        logger.info(f"Google Sheets: Successfully wrote {len(data_matrix)} rows × {len(data_matrix[0])} columns")
-                        progress_queue.put(f"STATUS|✅ Google Sheets sync complete! ({len(data_matrix)} rows)")
-                        
-                    except Exception as sheets_error:
-                        logger.error(f"Google Sheets sync error: {sheets_error}")
-                        import traceback
-                        logger.error(traceback.format_exc())
-                        progress_queue.put(f"STATUS|⚠️ Sheets sync failed: {str(sheets_error)[:50]}")
-                
+                    progress_queue.put(f"STATUS|☁️ Syncing to Google Sheets in background...")
+                    future = _sheets_pool.submit(self._sync_to_sheets, master_matrix)
+                    future.add_done_callback(_log_sync_outcome)
+
                 progress_queue.put(f"COMPLETE|{self.session_id}")
             else:
                 progress_queue.put(f"ERROR|Failed to generate consolidated master Excel file")
                 
         except Exception as e:
-            logger.error(f"Pipeline error: {e}")
+            logger.exception(f"Pipeline error: {e}")
             progress_queue.put(f"ERROR|{str(e)}")
+        finally:
+            # Sentinel: tells the SSE loop the run is over, no liveness
+            # polling needed
+            progress_queue.put(None)
+
+    def _sync_to_sheets(self, master_matrix):
+        """Upload the master file contents to Google Sheets.
+
+        Runs fire-and-forget in a daemon thread after COMPLETE has been
+        emitted, so progress is reported through the logger only - the SSE
+        stream is already closed by the time this finishes.
+        """
+        try:
+            import gspread
+            from google.oauth2.service_account import Credentials
+            if master_matrix is not None:
+                # Reuse the matrix captured while the master file was
+                # still in memory - no disk round-trip.
+                data_matrix = [
+                    ['' if val is None else str(val) for val in row]
+                    for row in master_matrix
+                ]
+            else:
+                from openpyxl import load_workbook
+
+                # Fallback: stream the master file row by row - read_only
+                # never materializes the cell tree, and stringification
+                # happens in the same pass.
+                wb = load_workbook(self.output_file, read_only=True, data_only=True)
+                ws = wb['Master Data']
+                data_matrix = [
+                    ['' if val is None else str(val) for val in row]
+                    for row in ws.iter_rows(values_only=True)
+                ]
+                wb.close()
+
+            # === NEW LOGIC: Duplicate Column C (index 2) ===
+            # Requested as "add the two columns in the beginning and
+            # then populate the data from C column": new columns A
+            # and B both carry the original index-2 value. Building
+            # a fresh list per row is one contiguous copy, vs two
+            # O(row-width) shifts with insert(0, ...).
+            if len(data_matrix) > 0 and len(data_matrix[0]) >= 3:
+                data_matrix = [[row[2], row[2], *row] for row in data_matrix]
+
+            logger.info(f"Google Sheets: Syncing {len(data_matrix)} rows × {len(data_matrix[0])} columns")
+
+            # Connect to Google Sheets
+            SCOPES = ['https://www.googleapis.com/auth/spreadsheets', 'https://www.googleapis.com/auth/drive']
+            credentials = Credentials.from_service_account_file(
+                GOOGLE_SHEETS_CONFIG['credentials_file'],
+                scopes=SCOPES
+            )
+            client = gspread.authorize(credentials)
+            spreadsheet = client.open_by_key(GOOGLE_SHEETS_CONFIG['spreadsheet_id'])
+
+            # Get or create worksheet
+            worksheet_name = GOOGLE_SHEETS_CONFIG['worksheet_name']
+            try:
+                worksheet = spreadsheet.worksheet(worksheet_name)
+                # Clear existing data, then grow the grid if this upload
+                # needs more room than the sheet currently has. Only the
+                # existing-worksheet branch can be undersized - add_worksheet
+                # below is already created at the right dimensions, so
+                # resizing there would be a wasted API round-trip.
+                worksheet.clear()
+                if worksheet.row_count < len(data_matrix) or worksheet.col_count < len(data_matrix[0]):
+                    worksheet.resize(rows=len(data_matrix) + 10, cols=len(data_matrix[0]) + 5)
+            except gspread.WorksheetNotFound:
+                worksheet = spreadsheet.add_worksheet(
+                    title=worksheet_name,
+                    rows=max(len(data_matrix) + 10, 1000),
+                    cols=max(len(data_matrix[0]) + 5, 100)
+                )
+                logger.info(f"Google Sheets: Created new worksheet: {worksheet_name}")
+
+            # Write the matrix in row chunks (exact Excel replication).
+            # values_update hits the raw values.update endpoint directly,
+            # skipping worksheet.update's range parsing and cell-shaping
+            # layers. Chunking means a mid-upload failure only retries the
+            # chunk that broke instead of restarting the whole payload, and
+            # 429/503 rate-limit responses get exponential backoff.
+            total_rows = len(data_matrix)
+            for start in range(0, total_rows, _SHEETS_CHUNK_ROWS):
+                chunk = data_matrix[start:start + _SHEETS_CHUNK_ROWS]
+                for attempt in range(_SHEETS_MAX_RETRIES):
+                    try:
+                        spreadsheet.values_update(
+                            f"'{worksheet_name}'!A{start + 1}",
+                            params={'valueInputOption': 'RAW'},
+                            body={'values': chunk}
+                        )
+                        break
+                    except gspread.exceptions.APIError as api_error:
+                        status = api_error.response.status_code
+                        if status not in (429, 503) or attempt == _SHEETS_MAX_RETRIES - 1:
+                            raise
+                        delay = 2 ** attempt
+                        logger.warning(
+                            f"Google Sheets: HTTP {status} on rows "
+                            f"{start + 1}+, retrying in {delay}s"
+                        )
+                        time.sleep(delay)
+                logger.info(
+                    f"Google Sheets: wrote rows "
+                    f"{min(start + _SHEETS_CHUNK_ROWS, total_rows)}/{total_rows}"
+                )
+
+            # Format header row (row 2 = index 1) as bold
+            worksheet.format('2:2', {'textFormat': {'bold': True}})
+
+            logger.info(f"Google Sheets: Successfully wrote {len(data_matrix)} rows × {len(data_matrix[0])} columns")
+
+        except Exception as sheets_error:
+            # logger.exception formats the traceback lazily via exc_info,
+            # only when a handler actually emits the record
+            logger.exception(f"Google Sheets sync error: {sheets_error}")
+
+
+def _sse_frame(item) -> bytes:
+    """Wrap one (event_id, message) pair in SSE wire framing.
+
+    The id field lets a reconnecting EventSource send Last-Event-ID and
+    resume from where the stream dropped instead of from scratch. Frames
+    are encoded here so the generator yields bytes and Werkzeug passes
+    them through instead of encoding every yield itself.
+    """
+    event_id, msg = item
+    return f"id: {event_id}\ndata: {msg}\n\n".encode('utf-8')
+
+
+def _coalesce_progress(items: list) -> list:
+    """Drop superseded PROGRESS messages, keeping only the latest one.
+
+    Intermediate progress states are meaningless once a newer one exists,
+    so there is no point pushing them down the socket. Items are
+    (event_id, message) pairs.
+    """
+    latest_progress = None
+    for item in items:
+        if item[1].startswith('PROGRESS|'):
+            latest_progress = item
+
+    if latest_progress is None:
+        return items
+
+    return [
+        item for item in items
+        if not item[1].startswith('PROGRESS|') or item is latest_progress
+    ]
 
 
 # ============== ROUTES ==============
 @app.route('/')
 def index():
-    """Serve the dashboard."""
-    # Construct Google Sheet URL
-    spreadsheet_id = GOOGLE_SHEETS_CONFIG.get('spreadsheet_id')
-    google_sheet_url = f"https://docs.google.com/spreadsheets/d/{spreadsheet_id}" if spreadsheet_id else None
-    
-    return render_template_string(DASHBOARD_HTML, google_sheet_url=google_sheet_url)
+    """Serve the dashboard (pre-rendered and pre-compressed at import time)."""
+    accepted = request.accept_encodings
+    if _DASHBOARD_BROTLI is not None and 'br' in accepted:
+        body, encoding = _DASHBOARD_BROTLI, 'br'
+    elif 'gzip' in accepted:
+        body, encoding = _DASHBOARD_GZIP, 'gzip'
+    else:
+        body, encoding = _DASHBOARD_BYTES, None
+
+    response = Response(body, mimetype='text/html')
+    if encoding:
+        response.headers['Content-Encoding'] = encoding
+        response.headers['Vary'] = 'Accept-Encoding'
+        response.set_etag(f"{_DASHBOARD_ETAG}-{encoding}")
+    else:
+        response.set_etag(_DASHBOARD_ETAG)
+    response.cache_control.max_age = 3600
+    return response.make_conditional(request)
+
+
+def _parse_period_args(month_str: str, year_str: str):
+    """Parse and range-check the month/year query params.
+
+    Returns (month, year), or None for anything non-numeric or outside
+    1-12 / 2000-2100 - bad input is rejected before a pipeline thread
+    and session are created for it.
+    """
+    try:
+        month = int(month_str)
+        year = int(year_str)
+    except (TypeError, ValueError):
+        return None
+    if not (1 <= month <= 12 and 2000 <= year <= 2100):
+        return None
+    return month, year
 
 
 @app.route('/stream')
 def stream():
     """SSE endpoint for pipeline progress.
-    
+
     UPDATED: Now accepts single month and year.
     """
     # Parse month and year
     month_str = request.args.get('month', str(time.localtime().tm_mon))
     year_str = request.args.get('year', str(time.localtime().tm_year))
     sync_str = request.args.get('sync', 'true')
-    
-    try:
-        month = int(month_str)
-        year = int(year_str)
-        months = [month]
-        years = [year]
-    except ValueError:
+
+    period = _parse_period_args(month_str, year_str)
+    if period is None:
         return "Invalid date format", 400
-        
+    month, year = period
+    months = [month]
+    years = [year]
+
     sync_to_sheets = sync_str.lower() == 'true'
     
     # Generate session ID based on period
     session_id = f"report_{month}_{year}_{int(time.time())}"
-    
+
+    # A reconnecting EventSource reports the last event it saw; captured
+    # here because the request context is gone once streaming starts
+    try:
+        last_event_id = int(request.headers.get('Last-Event-ID', -1))
+    except ValueError:
+        last_event_id = -1
+
     def generate():
-        local_queue = queue.Queue()
-        
-        # Start pipeline in background thread with ALL months and years
-        runner = PipelineRunner(months, years, session_id, sync_to_sheets)
-        thread = threading.Thread(target=runner.run, args=(local_queue,))
-        thread.start()
-        
-        # Stream progress events
-        while thread.is_alive() or not local_queue.empty():
-            try:
-                msg = local_queue.get(timeout=0.5)
-                yield f"data: {msg}\n\n"
-            except queue.Empty:
-                continue
-        
-        # Ensure final message is sent
+        # Join an identical in-flight run when one exists; otherwise become
+        # its owner and start the pipeline. Either way this consumer reads
+        # from its own ProgressChannel fed by the shared broadcast.
+        run_key = (month, year, sync_to_sheets)
+        with _inflight_lock:
+            broadcast = _inflight.get(run_key)
+            owner = broadcast is None
+            if owner:
+                broadcast = _BroadcastChannel()
+                _inflight[run_key] = broadcast
+
+        channel = broadcast.subscribe(last_event_id)
+        with _job_channels_lock:
+            job_channels[session_id] = channel
+
         try:
-            while not local_queue.empty():
-                msg = local_queue.get_nowait()
-                yield f"data: {msg}\n\n"
-        except queue.Empty:
-            pass
+            if owner:
+                # Start pipeline on the shared worker pool with ALL months
+                # and years, dropping the registry entry when it finishes
+                runner = PipelineRunner(months, years, session_id, sync_to_sheets)
+                broadcast.runner = runner
+
+                def run_and_unregister():
+                    try:
+                        runner.run(broadcast)
+                    finally:
+                        with _inflight_lock:
+                            _inflight.pop(run_key, None)
+
+                PIPELINE_POOL.submit(run_and_unregister)
+
+            # Tell EventSource to back off 10s before reconnecting - a dropped
+            # stream otherwise retries within ~3s and kicks off a fresh run
+            yield b"retry: 10000\n\n"
+
+            # Stream progress events until the runner's None sentinel arrives -
+            # each drain is flushed as one socket write, with stale PROGRESS
+            # messages dropped before sending
+            done = False
+            while not done:
+                messages = channel.drain(timeout=_SSE_KEEPALIVE)
+                if not messages:
+                    # Quiet stretch (scrape/extraction in progress): emit an
+                    # SSE comment so intermediaries keep the socket open
+                    yield b": keepalive\n\n"
+                    continue
+                # Brief coalescing window: bursts (e.g. parallel download
+                # callbacks) land within milliseconds of each other, so fold
+                # the stragglers into the same frame instead of waking the
+                # client per message
+                time.sleep(0.05)
+                messages += channel.drain(timeout=0)
+                if None in messages:
+                    done = True
+                    messages = [msg for msg in messages if msg is not None]
+                messages = _coalesce_progress(messages)
+                if messages:
+                    yield b''.join(map(_sse_frame, messages))
+        finally:
+            # Runs on completion and on GeneratorExit (client disconnect).
+            # Dropping the last subscriber flags the runner cancelled so an
+            # abandoned pipeline stops at its next step boundary.
+            broadcast.unsubscribe(channel)
+            with _job_channels_lock:
+                job_channels.pop(session_id, None)
     
-    return Response(generate(), mimetype='text/event-stream')
+    # no-cache stops intermediaries from buffering the stream;
+    # X-Accel-Buffering disables nginx response buffering so each frame
+    # flushes to the browser immediately
+    return Response(
+        generate(),
+        mimetype='text/event-stream',
+        headers={
+            'Cache-Control': 'no-cache',
+            'X-Accel-Buffering': 'no',
+        }
+    )
 
 
 @app.route('/download')
 def download():
     """Download the generated master Excel file."""
     session_id = request.args.get('session')
-    
-    if not session_id or session_id not in active_sessions:
+
+    if not session_id:
         return "No file available", 404
-    
-    session = active_sessions[session_id]
+
+    with _sessions_lock:
+        known = session_id in active_sessions
+    if not known:
+        # A worker recycle drops in-memory state; the run may be persisted
+        _load_sessions()
+
+    with _sessions_lock:
+        session = active_sessions.get(session_id)
+        if session is None:
+            return "No file available", 404
+        # Keep re-downloaded reports alive: refresh the entry's age
+        session['timestamp'] = time.time()
+        active_sessions.move_to_end(session_id)
     file_path = Path(session['file'])
-    
-    if not file_path.exists():
+
+    # conditional=True enables Range requests and 304s; the file is
+    # immutable for a given session so clients may cache it briefly.
+    # send_from_directory additionally refuses any name that escapes the
+    # directory, so a tampered persisted session can't serve arbitrary
+    # paths - and raises 404 itself for a vanished file, so no separate
+    # exists() stat is needed here.
+    try:
+        return send_from_directory(
+            file_path.parent,
+            file_path.name,
+            mimetype='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+            as_attachment=True,
+            download_name=file_path.name,
+            conditional=True,
+            max_age=3600
+        )
+    except NotFound:
         return "File not found", 404
-    
-    return send_file(
-        file_path,
-        mimetype='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
-        as_attachment=True,
-        download_name=file_path.name
-    )
+
+
+# TTL cache for the month list - it changes at most monthly, yet every
+# dashboard page load asks for it. The lock doubles as stampede protection:
+# concurrent first requests line up behind one upstream fetch.
+_months_cache = {'value': None, 'expires': 0.0}
+_MONTHS_TTL = int(os.environ.get('FADA_MONTHS_TTL', 3600))
+_months_lock = threading.Lock()
+
+
+def _available_months_cached() -> list:
+    """Month list cached for _MONTHS_TTL seconds."""
+    with _months_lock:
+        if _months_cache['value'] is None or time.time() >= _months_cache['expires']:
+            _months_cache['value'] = get_available_months()
+            _months_cache['expires'] = time.time() + _MONTHS_TTL
+        return _months_cache['value']
 
 
 @app.route('/available-months')
 def available_months():
     """Get list of available months from FADA website."""
     try:
-        months = get_available_months()
+        months = _available_months_cached()
         return jsonify({'months': months})
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 
+@app.route('/admin/invalidate-cache')
+def invalidate_cache():
+    """Manually invalidate the cached FADA link list."""
+    invalidate_links_cache()
+    return jsonify({'status': 'cache invalidated'})
+
+
 @app.route('/status')
 def status():
     """Get pipeline status."""
     return jsonify({
         'active_sessions': len(active_sessions),
-        'output_dir': str(OUTPUT_DIR)
+        'running_pipelines': len(job_channels),
+        'output_dir': OUTPUT_DIR_STR
     })
 
 
 # ============== MAIN ==============
 if __name__ == '__main__':
+    # Production runs under gunicorn (see Procfile and gunicorn_conf.py).
+    # When launched directly, serve through waitress unless FADA_ENV=dev -
+    # the Werkzeug dev server is single-process and pays debug-middleware
+    # overhead on every SSE frame. channel_timeout must outlive the longest
+    # pipeline run or waitress reaps the stream mid-flight.
     port = int(os.environ.get('PORT', 5000))
     print(f"\n>>> FADA Data Dashboard starting on http://localhost:{port}\n")
-    app.run(host='0.0.0.0', port=port, debug=True, threaded=True)
+    if os.environ.get('FADA_ENV', 'production') == 'dev':
+        debug = os.environ.get('FLASK_DEBUG', '0') == '1'
+        app.run(host='0.0.0.0', port=port, debug=debug, threaded=True)
+    else:
+        from waitress import serve
+        serve(
+            app,
+            host='0.0.0.0',
+            port=port,
+            threads=int(os.environ.get('FADA_WSGI_THREADS', 8)),
+            channel_timeout=3600
+        )
@@ -12,10 +12,8 @@ from pathlib import Path
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import requests
 
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from config import FADA_CONFIG, DOWNLOAD_CONFIG, PDF_DIR, CACHE_FILE
+from utils.http import get_http_session
 from utils.logger import get_logger
 from utils.cache import ProcessingCache
 
@@ -37,9 +35,11 @@ def download_single_pdf(url: str, save_path: Path, headers: dict,
     """
     filename = save_path.name
     
+    session = get_http_session()
+
     for attempt in range(retries):
         try:
-            response = requests.get(url, headers=headers, timeout=timeout)
+            response = session.get(url, headers=headers, timeout=timeout)
             response.raise_for_status()
             
             # Verify it's actually a PDF (check content type or magic bytes)
@@ -99,7 +99,7 @@ def download_pdfs(pdf_links: List[Dict],
     output_dir.mkdir(parents=True, exist_ok=True)
     
     if max_workers is None:
-        max_workers = DOWNLOAD_CONFIG['max_workers']
+        max_workers = int(os.environ.get('FADA_DL_THREADS', DOWNLOAD_CONFIG['max_workers']))
     
     headers = FADA_CONFIG['request_headers']
     timeout = FADA_CONFIG['request_timeout']
@@ -11,12 +11,9 @@ import pdfplumber
 from pathlib import Path
 from typing import List, Tuple, Optional
 
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from config import COLUMNS_TO_REMOVE, EXCEL_DIR, PDF_DIR, CACHE_FILE
 from utils.logger import get_logger
-from utils.cache import ProcessingCache
+from utils.cache import ProcessingCache, compute_file_hash
 from filters.date_filter import parse_month_year_from_filename
 
 
@@ -247,22 +244,30 @@ def process_all_pdfs(pdf_dir: Path = None,
         excel_filename = pdf_file.stem + "_tables.xlsx"
         expected_excel_path = output_dir / excel_filename
         
+        # Hash the PDF bytes so a re-uploaded file with the same name is
+        # detected and re-extracted instead of reusing a stale Excel
+        pdf_hash = compute_file_hash(pdf_file)
+
         # FIXED: Verify Excel file actually exists, not just in cache
         # This fixes cloud deployment where cache exists but files don't
         if cache.is_processed(pdf_file.name):
-            if expected_excel_path.exists():
+            cached_hash = cache.get_content_hash(pdf_file.name)
+            if not expected_excel_path.exists():
+                logger.info(f"Cache says {pdf_file.name} processed but Excel not found, re-processing")
+            elif cached_hash is not None and cached_hash != pdf_hash:
+                logger.info(f"{pdf_file.name} content changed since last extraction, re-processing")
+            else:
                 logger.debug(f"Skipping already processed: {pdf_file.name}")
                 results.append(expected_excel_path)
                 continue
-            else:
-                logger.info(f"Cache says {pdf_file.name} processed but Excel not found, re-processing")
-        
+
         try:
             excel_path = process_pdf_file(pdf_file, output_dir)
-            
+
             if excel_path:
                 parsed_month, parsed_year = parse_month_year_from_filename(pdf_file.name)
-                cache.mark_processed(pdf_file.name, excel_path, parsed_month, parsed_year)
+                cache.mark_processed(pdf_file.name, excel_path, parsed_month, parsed_year,
+                                     content_hash=pdf_hash)
                 results.append(excel_path)
             else:
                 cache.mark_failed(pdf_file.name, "No valid tables extracted")
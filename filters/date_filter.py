@@ -5,13 +5,12 @@ Filters PDFs by month and year selection.
 
 import re
 from typing import List, Dict, Optional
-from pathlib import Path
-
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from config import MONTH_PATTERNS
 
+# 4-digit year, compiled once - this runs per link on every filter pass
+_YEAR_RE = re.compile(r'(20[1-3][0-9])')
+
 
 def parse_month_year_from_filename(filename: str) -> tuple:
     """
@@ -33,101 +32,88 @@ def parse_month_year_from_filename(filename: str) -> tuple:
             break
     
     # Find year (4-digit year)
-    year_match = re.search(r'(20[1-3][0-9])', filename)
+    year_match = _YEAR_RE.search(filename)
     year = int(year_match.group(1)) if year_match else None
     
     return month_num, year
 
 
+def _resolve_period(link: Dict) -> tuple:
+    """
+    Resolve a link's (month, year), falling back to filename parsing.
+
+    Args:
+        link: PDF link dict with optional 'month', 'year', 'filename' keys
+
+    Returns:
+        Tuple of (month, year), either may be None
+    """
+    link_month = link.get('month')
+    link_year = link.get('year')
+
+    # If month/year not in link dict, try to parse from filename
+    if link_month is None or link_year is None:
+        parsed_month, parsed_year = parse_month_year_from_filename(link.get('filename', ''))
+        link_month = link_month or parsed_month
+        link_year = link_year or parsed_year
+
+    return link_month, link_year
+
+
 def filter_by_month_year(pdf_links: List[Dict], month: int, year: int) -> List[Dict]:
     """
     Filter PDF links to only include those matching the specified month and year.
-    
+
     Args:
         pdf_links: List of PDF link dicts with 'filename', 'month', 'year' keys
         month: Target month (1-12)
         year: Target year (e.g., 2024)
-        
+
     Returns:
         Filtered list of PDF link dicts
     """
-    filtered = []
-    
-    for link in pdf_links:
-        link_month = link.get('month')
-        link_year = link.get('year')
-        
-        # If month/year not in link dict, try to parse from filename
-        if link_month is None or link_year is None:
-            parsed_month, parsed_year = parse_month_year_from_filename(link.get('filename', ''))
-            link_month = link_month or parsed_month
-            link_year = link_year or parsed_year
-        
-        # Check if matches target month and year
-        if link_month == month and link_year == year:
-            filtered.append(link)
-    
-    return filtered
+    return [link for link in pdf_links if _resolve_period(link) == (month, year)]
 
 
 def filter_by_year(pdf_links: List[Dict], year: int) -> List[Dict]:
     """
     Filter PDF links to only include those from a specific year.
-    
+
     Args:
         pdf_links: List of PDF link dicts
         year: Target year (e.g., 2024)
-        
+
     Returns:
         Filtered list of PDF link dicts
     """
-    filtered = []
-    
-    for link in pdf_links:
-        link_year = link.get('year')
-        
-        if link_year is None:
-            _, parsed_year = parse_month_year_from_filename(link.get('filename', ''))
-            link_year = parsed_year
-        
-        if link_year == year:
-            filtered.append(link)
-    
-    return filtered
+    return [link for link in pdf_links if _resolve_period(link)[1] == year]
 
 
-def filter_by_date_range(pdf_links: List[Dict], 
+def filter_by_date_range(pdf_links: List[Dict],
                           start_month: int, start_year: int,
                           end_month: int, end_year: int) -> List[Dict]:
     """
     Filter PDF links within a date range.
-    
+
     Args:
         pdf_links: List of PDF link dicts
         start_month, start_year: Start of range (inclusive)
         end_month, end_year: End of range (inclusive)
-        
+
     Returns:
         Filtered list of PDF link dicts
     """
-    filtered = []
     start_date = start_year * 12 + start_month
     end_date = end_year * 12 + end_month
-    
+
+    filtered = []
     for link in pdf_links:
-        link_month = link.get('month')
-        link_year = link.get('year')
-        
-        if link_month is None or link_year is None:
-            parsed_month, parsed_year = parse_month_year_from_filename(link.get('filename', ''))
-            link_month = link_month or parsed_month
-            link_year = link_year or parsed_year
-        
+        link_month, link_year = _resolve_period(link)
         if link_month and link_year:
             link_date = link_year * 12 + link_month
             if start_date <= link_date <= end_date:
                 filtered.append(link)
-    
+
     return filtered
 
 
@@ -145,15 +131,8 @@ def find_latest_period(pdf_links: List[Dict]) -> tuple:
     latest_month, latest_year = None, None
     
     for link in pdf_links:
-        link_month = link.get('month')
-        link_year = link.get('year')
-        
-        # If month/year not in link dict, try to parse from filename
-        if link_month is None or link_year is None:
-            parsed_month, parsed_year = parse_month_year_from_filename(link.get('filename', ''))
-            link_month = link_month or parsed_month
-            link_year = link_year or parsed_year
-        
+        link_month, link_year = _resolve_period(link)
+
         if link_month and link_year:
             date_val = link_year * 12 + link_month
             if date_val > latest_date:
@@ -0,0 +1,19 @@
+"""
+Gunicorn configuration for the FADA ETL Pipeline.
+
+SSE /stream connections are long-lived: each one pins a thread for the
+duration of a pipeline run. A plain sync worker would serialize every other
+request (dashboard, downloads) behind the stream, so use the threaded
+worker class with enough threads per worker to serve them concurrently.
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '5000')}"
+workers = int(os.environ.get('WEB_CONCURRENCY', '2'))
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', '8'))
+
+# SSE streams outlive the default 30s worker timeout
+timeout = 0
+keepalive = 75
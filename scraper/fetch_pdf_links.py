@@ -6,17 +6,18 @@ This module preserves the original scraping logic from Full_automation.ipynb
 while adding structured metadata extraction.
 """
 
+import os
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional
 from urllib.parse import urljoin
 from bs4 import BeautifulSoup
 import requests
 
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from config import FADA_CONFIG, MONTH_PATTERNS, MONTH_NAMES
+from utils.http import get_http_session
 from utils.logger import get_logger
 
 
@@ -46,6 +47,21 @@ def extract_month_year_from_filename(filename: str) -> tuple:
     return month_num, year
 
 
+def _fetch_page(session, url: str, timeout: int,
+                capture_validators: bool = False) -> str:
+    """Fetch one listing page and return its HTML.
+
+    With capture_validators the response's ETag/Last-Modified are stored
+    on the links cache so a later refresh can revalidate cheaply.
+    """
+    response = session.get(url, timeout=timeout)
+    response.raise_for_status()
+    if capture_validators:
+        _LINKS_CACHE['etag'] = response.headers.get('ETag')
+        _LINKS_CACHE['last_modified'] = response.headers.get('Last-Modified')
+    return response.text
+
+
 def fetch_pdf_links(max_pages: int = None) -> List[Dict]:
     """
     Fetch all PDF links from FADA press release pages.
@@ -70,68 +86,163 @@ def fetch_pdf_links(max_pages: int = None) -> List[Dict]:
     if max_pages is None:
         max_pages = FADA_CONFIG['max_pages']
     
-    headers = FADA_CONFIG['request_headers']
     base_page_url = FADA_CONFIG['base_page_url']
     base_site_url = FADA_CONFIG['base_site_url']
     timeout = FADA_CONFIG['request_timeout']
-    
+    session = get_http_session()
+
     pdf_links = []
     seen_urls = set()
     
     logger.info(f"Starting PDF link extraction from FADA website (max {max_pages} pages)")
-    
-    for page in range(1, max_pages + 1):
-        url = base_page_url + str(page)
-        
-        try:
-            response = requests.get(url, headers=headers, timeout=timeout)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Find all PDF links
-            for link in soup.find_all('a', href=lambda href: href and href.lower().endswith('.pdf')):
-                href = link['href']
-                
-                # Skip if already seen
-                if href in seen_urls:
-                    continue
-                
-                # Get filename
-                filename = href.split('/')[-1] if '/' in href else href
-                basename_lower = filename.lower()
-                
-                # Filter: only include PDFs with month names (vehicle retail data)
-                if not any(month in basename_lower for month in MONTH_NAMES):
-                    continue
-                
-                # Build full URL
-                pdf_url = urljoin(base_site_url, href)
-                seen_urls.add(href)
-                
-                # Extract month and year
-                month, year = extract_month_year_from_filename(filename)
-                
-                pdf_links.append({
-                    'url': pdf_url,
-                    'filename': filename,
-                    'month': month,
-                    'year': year,
-                    'page_found': page
-                })
-            
-            logger.debug(f"Page {page}: Found {len(pdf_links)} total PDF links")
-            
-        except requests.RequestException as e:
-            logger.warning(f"Error fetching page {page}: {e}")
-            continue
-        except Exception as e:
-            logger.error(f"Unexpected error on page {page}: {e}")
-            continue
-    
+
+    # Fetch all listing pages concurrently (the pooled session keeps the
+    # connection alive across them), then parse in page order so the
+    # first-occurrence dedup stays deterministic
+    with ThreadPoolExecutor(max_workers=min(max_pages, 8)) as executor:
+        page_futures = {
+            page: executor.submit(_fetch_page, session, base_page_url + str(page),
+                                  timeout, capture_validators=(page == 1))
+            for page in range(1, max_pages + 1)
+        }
+
+        for page in range(1, max_pages + 1):
+            try:
+                html = page_futures[page].result()
+                soup = BeautifulSoup(html, 'html.parser')
+
+                # Find all PDF links
+                for link in soup.find_all('a', href=lambda href: href and href.lower().endswith('.pdf')):
+                    href = link['href']
+
+                    # Skip if already seen
+                    if href in seen_urls:
+                        continue
+
+                    # Get filename
+                    filename = href.split('/')[-1] if '/' in href else href
+                    basename_lower = filename.lower()
+
+                    # Filter: only include PDFs with month names (vehicle retail data)
+                    if not any(month in basename_lower for month in MONTH_NAMES):
+                        continue
+
+                    # Build full URL
+                    pdf_url = urljoin(base_site_url, href)
+                    seen_urls.add(href)
+
+                    # Extract month and year
+                    month, year = extract_month_year_from_filename(filename)
+
+                    pdf_links.append({
+                        'url': pdf_url,
+                        'filename': filename,
+                        'month': month,
+                        'year': year,
+                        'page_found': page
+                    })
+
+                logger.debug(f"Page {page}: Found {len(pdf_links)} total PDF links")
+
+            except requests.RequestException as e:
+                logger.warning(f"Error fetching page {page}: {e}")
+                continue
+            except Exception as e:
+                logger.error(f"Unexpected error on page {page}: {e}")
+                continue
+
     logger.info(f"Extraction complete: Found {len(pdf_links)} PDF links with month data")
     return pdf_links
 
 
+# TTL cache for fetch_pdf_links() - back-to-back pipeline runs within a few
+# minutes would otherwise re-scrape identical FADA pages. The lock also
+# serializes a burst of concurrent runs so only one of them scrapes.
+_LINKS_CACHE = {'ts': 0.0, 'data': None, 'version': 0,
+                'etag': None, 'last_modified': None}
+_LINKS_TTL = int(os.environ.get('FADA_LINKS_TTL', 600))  # seconds
+_links_lock = threading.Lock()
+
+
+def _first_page_unchanged() -> bool:
+    """Revalidate the cached link list against page 1 of the listing.
+
+    New press releases always surface on the first page, so a 304 there
+    means the whole cached list is still good. Any error or missing
+    validator falls through to a full re-scrape.
+    """
+    headers = {}
+    if _LINKS_CACHE['etag']:
+        headers['If-None-Match'] = _LINKS_CACHE['etag']
+    if _LINKS_CACHE['last_modified']:
+        headers['If-Modified-Since'] = _LINKS_CACHE['last_modified']
+    if not headers:
+        return False
+    try:
+        response = get_http_session().get(
+            FADA_CONFIG['base_page_url'] + '1',
+            headers=headers,
+            timeout=FADA_CONFIG['request_timeout']
+        )
+    except requests.RequestException:
+        return False
+    return response.status_code == 304
+
+
+def fetch_pdf_links_cached(max_pages: int = None, with_version: bool = False):
+    """
+    Fetch PDF links, reusing a recent result if one is available.
+
+    Results are cached in-process for _LINKS_TTL seconds so repeat pipeline
+    runs skip the HTTP round-trips to the FADA website entirely. Past the
+    TTL, a conditional GET against the first listing page extends the
+    cache's life when the site reports it unchanged - one cheap 304
+    instead of re-fetching and re-parsing every page.
+
+    Args:
+        max_pages: Maximum number of pages to scrape (default from config)
+        with_version: Also return the cache version the snapshot belongs to
+
+    Returns:
+        List of PDF link dicts (same format as fetch_pdf_links), or a
+        (links, version) tuple when with_version is set. Callers memoizing
+        derived results must key them on this version rather than a later
+        links_cache_version() read: the cache can refresh in between,
+        silently filing a stale computation under the new version.
+    """
+    with _links_lock:
+        now = time.time()
+        if _LINKS_CACHE['data'] is None or now - _LINKS_CACHE['ts'] > _LINKS_TTL:
+            if _LINKS_CACHE['data'] is not None and _first_page_unchanged():
+                _LINKS_CACHE['ts'] = now
+            else:
+                _LINKS_CACHE['data'] = fetch_pdf_links(max_pages=max_pages)
+                _LINKS_CACHE['ts'] = now
+                _LINKS_CACHE['version'] += 1
+        if with_version:
+            return _LINKS_CACHE['data'], _LINKS_CACHE['version']
+        return _LINKS_CACHE['data']
+
+
+def links_cache_version() -> int:
+    """Version counter for the links cache, bumped on every fresh scrape.
+
+    Callers can key derived computations (filters, aggregations) on this
+    value so they are invalidated exactly when the link list changes.
+    """
+    with _links_lock:
+        return _LINKS_CACHE['version']
+
+
+def invalidate_links_cache() -> None:
+    """Force the next fetch_pdf_links_cached() call to re-scrape."""
+    with _links_lock:
+        _LINKS_CACHE['ts'] = 0.0
+        _LINKS_CACHE['data'] = None
+        _LINKS_CACHE['etag'] = None
+        _LINKS_CACHE['last_modified'] = None
+
+
 def get_available_months(pdf_links: List[Dict] = None) -> List[Dict]:
     """
     Get list of available month/year combinations from PDF links.
@@ -143,8 +254,8 @@ def get_available_months(pdf_links: List[Dict] = None) -> List[Dict]:
         List of {month, year, count} dicts sorted by date
     """
     if pdf_links is None:
-        pdf_links = fetch_pdf_links()
-    
+        pdf_links = fetch_pdf_links_cached()
+
     month_years = {}
     for link in pdf_links:
         if link['month'] and link['year']:
@@ -22,13 +22,11 @@ import pandas as pd
 from pathlib import Path
 from datetime import datetime
 from collections import defaultdict, OrderedDict
-from openpyxl import Workbook
-from openpyxl.styles import Font, Alignment, Border, Side
+from openpyxl import Workbook, load_workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font
 from typing import List, Dict, Optional, Tuple, Any
 
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from config import EXCEL_DIR, OUTPUT_DIR, CACHE_FILE
 from utils.logger import get_logger
 from filters.date_filter import parse_month_year_from_filename
@@ -280,196 +278,246 @@ def sort_timepoints_columns(timepoints: set) -> List[str]:
     return fys_sorted + months_sorted
 
 
-def build_comprehensive_master(excel_dir: Path = None,
-                                output_dir: Path = None) -> Optional[Path]:
+# Workbook styles, built once - openpyxl interns shared style objects, so
+# reusing these handles avoids per-build (and per-cell) style churn
+HEADER_FONT = Font(bold=True)
+SECTION_FONT = Font(bold=True, size=12)
+
+# Preferred section order in the master workbook; tables not listed here
+# are appended alphabetically after these
+TABLE_ORDER = [
+    'Retail Data Summary',
+    'Inventory Days',
+    'Two Wheeler (2W)',
+    'Two-Wheeler EV OEM',
+    'Three Wheeler (3W)',
+    'Three-Wheeler EV OEM',
+    '3W Subcategories',
+    'Passenger Vehicle (PV)',
+    'PV EV OEM',
+    'Commercial Vehicle (CV)',
+    'Commercial Vehicle EV OEM',
+    'Tractor (TRAC)',
+    'Construction Equipment',
+    'Retail Strength Urban',
+    'Retail Strength Rural',
+    'Road Tax Collection',
+    'EV Penetration',
+    'Fuel Wise Market Share',
+]
+
+
+def _aggregate_excel_data(excel_files: List[Path]) -> Tuple[Dict, set]:
     """
-    Build comprehensive master Excel extracting ALL table data.
+    Aggregate table data from a list of extracted Excel files.
+
+    Args:
+        excel_files: Paths to *_tables.xlsx files produced by the extractor
+
+    Returns:
+        Tuple of (all_data, all_timepoints) where all_data is
+        {table_type: {row_label: {timepoint: value}}}
     """
     logger = get_logger()
-    
-    if excel_dir is None:
-        excel_dir = EXCEL_DIR
-    if output_dir is None:
-        output_dir = OUTPUT_DIR
-    
-    excel_dir = Path(excel_dir)
-    output_dir = Path(output_dir)
-    output_dir.mkdir(parents=True, exist_ok=True)
-    
-    excel_files = list(excel_dir.glob("*_tables.xlsx"))
-    
-    if not excel_files:
-        logger.warning(f"No Excel files found in {excel_dir}")
-        return None
-    
-    logger.info(f"Building comprehensive master from {len(excel_files)} files")
-    
+
     # Data storage: {table_type: {row_label: {timepoint: value}}}
     all_data = defaultdict(lambda: defaultdict(dict))
     all_timepoints = set()
-    
+
     # Process each file
     for file_path in sorted(excel_files):
         logger.info(f"Processing: {file_path.name}")
-        
+
         try:
-            xls = pd.ExcelFile(file_path)
-            
-            for sheet_name in xls.sheet_names:
-                df = pd.read_excel(xls, sheet_name=sheet_name, header=None)
-                
+            # read_only streams rows from the XML instead of materializing
+            # a full cell object tree per sheet
+            wb = load_workbook(file_path, read_only=True, data_only=True)
+
+            for ws_in in wb.worksheets:
+                rows = list(ws_in.iter_rows(values_only=True))
+
                 # Skip very small tables
-                if len(df) < 2:
+                if len(rows) < 2:
                     continue
-                
+
+                df = pd.DataFrame(rows)
                 table_type, data = extract_table_data(df)
-                
+
                 if data:
                     # If table type not identified, use sheet name
                     if not table_type:
-                        table_type = f"Sheet: {sheet_name}"
-                    
+                        table_type = f"Sheet: {ws_in.title}"
+
                     for row_label, timepoint_values in data.items():
                         for tp, val in timepoint_values.items():
                             # Merge data (newer files overwrite older)
                             all_data[table_type][row_label][tp] = val
                             all_timepoints.add(tp)
-                            
+
+            wb.close()
+
         except Exception as e:
             logger.error(f"Error processing {file_path}: {e}")
             continue
-    
-    if not all_data:
-        logger.warning("No data extracted from any files")
-        return None
-    
-    # Sort timepoints
-    sorted_timepoints = sort_timepoints_columns(all_timepoints)
-    
-    logger.info(f"Extracted data from {len(all_data)} table types")
-    logger.info(f"Total timepoints: {len(sorted_timepoints)}")
-    
-    # Create workbook
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Master Data"
-    
-    # Define styles
-    header_font = Font(bold=True)
-    section_font = Font(bold=True, size=12)
-    thin_border = Border(
-        left=Side(style='thin'),
-        right=Side(style='thin'),
-        top=Side(style='thin'),
-        bottom=Side(style='thin')
-    )
-    
-    row_idx = 1
-    
-    # Define the order of table types
-    table_order = [
-        'Retail Data Summary',
-        'Inventory Days',
-        'Two Wheeler (2W)',
-        'Two-Wheeler EV OEM',
-        'Three Wheeler (3W)',
-        'Three-Wheeler EV OEM',
-        '3W Subcategories',
-        'Passenger Vehicle (PV)',
-        'PV EV OEM',
-        'Commercial Vehicle (CV)',
-        'Commercial Vehicle EV OEM',
-        'Tractor (TRAC)',
-        'Construction Equipment',
-        'Retail Strength Urban',
-        'Retail Strength Rural',
-        'Road Tax Collection',
-        'EV Penetration',
-        'Fuel Wise Market Share',
-    ]
-    
-    # Add tables that are in order first
-    written_tables = set()
-    
-    for table_type in table_order:
-        if table_type in all_data:
-            written_tables.add(table_type)
-            table_data = all_data[table_type]
-            
-            # Section header
-            ws.cell(row_idx, 1, table_type).font = section_font
-            row_idx += 1
-            
-            # Column headers
-            ws.cell(row_idx, 1, "Item").font = header_font
-            for col_idx, tp in enumerate(sorted_timepoints, 2):
-                ws.cell(row_idx, col_idx, tp).font = header_font
-            row_idx += 1
-            
-            # Data rows - sort with TOTAL last
-            row_labels = sorted(table_data.keys(), 
-                              key=lambda x: (x.upper() == 'TOTAL' or x.upper() == 'TOTALS', x))
-            
-            for label in row_labels:
-                ws.cell(row_idx, 1, label)
-                for col_idx, tp in enumerate(sorted_timepoints, 2):
-                    val = table_data[label].get(tp)
-                    if val is not None:
-                        ws.cell(row_idx, col_idx, val)
-                row_idx += 1
-            
-            row_idx += 1  # Blank row between sections
-    
-    # Add any remaining tables not in the predefined order
-    for table_type in sorted(all_data.keys()):
-        if table_type in written_tables:
-            continue
-        
-        table_data = all_data[table_type]
-        
-        # Section header
-        ws.cell(row_idx, 1, table_type).font = section_font
-        row_idx += 1
-        
-        # Column headers
-        ws.cell(row_idx, 1, "Item").font = header_font
-        for col_idx, tp in enumerate(sorted_timepoints, 2):
-            ws.cell(row_idx, col_idx, tp).font = header_font
-        row_idx += 1
-        
-        # Data rows
-        row_labels = sorted(table_data.keys(), 
-                          key=lambda x: (x.upper() == 'TOTAL' or x.upper() == 'TOTALS', x))
-        
-        for label in row_labels:
-            ws.cell(row_idx, 1, label)
-            for col_idx, tp in enumerate(sorted_timepoints, 2):
-                val = table_data[label].get(tp)
-                if val is not None:
-                    ws.cell(row_idx, col_idx, val)
-            row_idx += 1
-        
-        row_idx += 1
-    
-    # Adjust column widths
-    ws.column_dimensions['A'].width = 45
-    for col_idx in range(2, len(sorted_timepoints) + 2):
-        ws.column_dimensions[chr(64 + col_idx) if col_idx <= 26 else 'A'].width = 12
-    
-    # Save
-    output_path = output_dir / "Master_FADA_Data.xlsx"
-    wb.save(output_path)
-    
+
+    return all_data, all_timepoints
+
+
+def _write_section(ws, table_type: str, table_data: Dict,
+                   sorted_timepoints: List[str]) -> None:
+    """Write one table section to the worksheet via whole-row appends."""
+    for values, font in _section_rows(table_type, table_data, sorted_timepoints):
+        ws.append(values)
+        if font is not None:
+            row_idx = ws.max_row
+            for col_idx in range(1, len(values) + 1):
+                ws.cell(row_idx, col_idx).font = font
+
+
+def _section_rows(table_type: str, table_data: Dict,
+                  sorted_timepoints: List[str]):
+    """Yield (values, font) pairs for one table section, in sheet order."""
+    yield [table_type], SECTION_FONT
+    yield ["Item", *sorted_timepoints], HEADER_FONT
+
+    # Data rows - sort with TOTAL last
+    row_labels = sorted(table_data.keys(),
+                      key=lambda x: (x.upper() == 'TOTAL' or x.upper() == 'TOTALS', x))
+    for label in row_labels:
+        values = table_data[label]
+        yield [label, *(values.get(tp) for tp in sorted_timepoints)], None
+
+    yield [], None  # Blank row between sections
+
+
+def _write_master_workbook(all_data: Dict, sorted_timepoints: List[str],
+                           output_path: Path,
+                           return_matrix: bool = False,
+                           use_write_only: bool = False):
+    """
+    Write the aggregated master data to an Excel workbook.
+
+    Args:
+        all_data: {table_type: {row_label: {timepoint: value}}}
+        sorted_timepoints: Timepoint column order (see sort_timepoints_columns)
+        output_path: Destination .xlsx path
+        return_matrix: Also return the sheet contents as a list of row lists,
+            saving consumers (the Sheets sync) a re-read of the saved file
+        use_write_only: Stream rows through openpyxl's write-only mode,
+            which never holds the cell tree in memory - peak RSS stays
+            near-constant instead of O(cells)
+
+    Returns:
+        output_path, or (output_path, matrix) when return_matrix is True
+    """
+    logger = get_logger()
+
+    # Table order: the predefined sequence first, then any leftovers
+    ordered_tables = [t for t in TABLE_ORDER if t in all_data]
+    ordered_tables += [t for t in sorted(all_data.keys())
+                       if t not in ordered_tables]
+
+    # Rows are padded to the full sheet width so the returned matrix has
+    # uniform row lengths (what iter_rows on a saved sheet would yield)
+    width = len(sorted_timepoints) + 1
+
+    if use_write_only:
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("Master Data")
+        # Write-only sheets require dimensions before the first append
+        ws.column_dimensions['A'].width = 45
+        for col_idx in range(2, len(sorted_timepoints) + 2):
+            ws.column_dimensions[chr(64 + col_idx) if col_idx <= 26 else 'A'].width = 12
+
+        matrix = []
+        for table_type in ordered_tables:
+            for values, font in _section_rows(table_type, all_data[table_type],
+                                              sorted_timepoints):
+                values = values + [None] * (width - len(values))
+                matrix.append(values)
+                if font is None:
+                    ws.append(values)
+                else:
+                    styled = []
+                    for val in values:
+                        cell = WriteOnlyCell(ws, value=val)
+                        cell.font = font
+                        styled.append(cell)
+                    ws.append(styled)
+        wb.save(output_path)
+        # The saved file trims the final all-empty separator row; keep the
+        # returned matrix consistent with what a re-read would yield
+        if matrix and all(v is None for v in matrix[-1]):
+            matrix.pop()
+    else:
+        wb = Workbook()
+        ws = wb.active
+        ws.title = "Master Data"
+
+        for table_type in ordered_tables:
+            _write_section(ws, table_type, all_data[table_type], sorted_timepoints)
+
+        # Adjust column widths
+        ws.column_dimensions['A'].width = 45
+        for col_idx in range(2, len(sorted_timepoints) + 2):
+            ws.column_dimensions[chr(64 + col_idx) if col_idx <= 26 else 'A'].width = 12
+
+        wb.save(output_path)
+
     # Log summary
     total_rows = sum(len(v) for v in all_data.values())
     logger.info(f"Master Excel saved to {output_path}")
     logger.info(f"  - Table types: {len(all_data)}")
     logger.info(f"  - Total row items: {total_rows}")
     logger.info(f"  - Timepoint columns: {len(sorted_timepoints)}")
-    
+
+    if return_matrix:
+        if use_write_only:
+            return output_path, matrix
+        return output_path, [list(row) for row in ws.iter_rows(values_only=True)]
     return output_path
 
 
+def build_comprehensive_master(excel_dir: Path = None,
+                                output_dir: Path = None) -> Optional[Path]:
+    """
+    Build comprehensive master Excel extracting ALL table data.
+    """
+    logger = get_logger()
+
+    if excel_dir is None:
+        excel_dir = EXCEL_DIR
+    if output_dir is None:
+        output_dir = OUTPUT_DIR
+
+    excel_dir = Path(excel_dir)
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    excel_files = list(excel_dir.glob("*_tables.xlsx"))
+
+    if not excel_files:
+        logger.warning(f"No Excel files found in {excel_dir}")
+        return None
+
+    logger.info(f"Building comprehensive master from {len(excel_files)} files")
+
+    all_data, all_timepoints = _aggregate_excel_data(excel_files)
+
+    if not all_data:
+        logger.warning("No data extracted from any files")
+        return None
+
+    # Sort timepoints
+    sorted_timepoints = sort_timepoints_columns(all_timepoints)
+
+    logger.info(f"Extracted data from {len(all_data)} table types")
+    logger.info(f"Total timepoints: {len(sorted_timepoints)}")
+
+    return _write_master_workbook(all_data, sorted_timepoints,
+                                  output_dir / "Master_FADA_Data.xlsx")
+
+
 def build_master_excel_for_month(month: int, year: int, 
                                   excel_dir: Path = None,
                                   output_dir: Path = None) -> Optional[Path]:
@@ -480,7 +528,9 @@ def build_master_excel_for_month(month: int, year: int,
 def build_consolidated_master(months: list = None, years: list = None,
                                output_period: tuple = None,
                                excel_dir: Path = None,
-                               output_dir: Path = None) -> Optional[Path]:
+                               output_dir: Path = None,
+                               return_matrix: bool = False,
+                               use_write_only: bool = False):
     """
     Build consolidated master Excel for specific months and years.
     
@@ -494,9 +544,11 @@ def build_consolidated_master(months: list = None, years: list = None,
         output_period: Optional tuple (month, year) - if provided, output only this period's data
         excel_dir: Directory containing extracted Excel files
         output_dir: Directory to save master file
-        
+        return_matrix: Also return the sheet contents as a list of row lists
+
     Returns:
-        Path to generated master Excel file, or None if no data
+        Path to generated master Excel file, or None if no data.
+        With return_matrix=True, a (path, matrix) tuple instead.
     """
     logger = get_logger()
     
@@ -514,165 +566,30 @@ def build_consolidated_master(months: list = None, years: list = None,
     
     if not all_excel_files:
         logger.warning(f"No Excel files found in {excel_dir}")
-        return None
-    
+        return (None, None) if return_matrix else None
+
     # Process ALL available Excel files to get complete historical data
     # When user selects a period (e.g., Jan 2025), we include all data up to that point
     # The months/years parameters are used for filename generation, not for filtering
     excel_files = all_excel_files
 
-    
     logger.info(f"Building consolidated master from {len(excel_files)} files")
-    
-    # Data storage: {table_type: {row_label: {timepoint: value}}}
-    all_data = defaultdict(lambda: defaultdict(dict))
-    all_timepoints = set()
-    
-    # Process each file
-    for file_path in sorted(excel_files):
-        logger.info(f"Processing: {file_path.name}")
-        
-        try:
-            xls = pd.ExcelFile(file_path)
-            
-            for sheet_name in xls.sheet_names:
-                df = pd.read_excel(xls, sheet_name=sheet_name, header=None)
-                
-                # Skip very small tables
-                if len(df) < 2:
-                    continue
-                
-                table_type, data = extract_table_data(df)
-                
-                if data:
-                    # If table type not identified, use sheet name
-                    if not table_type:
-                        table_type = f"Sheet: {sheet_name}"
-                    
-                    for row_label, timepoint_values in data.items():
-                        for tp, val in timepoint_values.items():
-                            # Merge data (newer files overwrite older)
-                            all_data[table_type][row_label][tp] = val
-                            all_timepoints.add(tp)
-                            
-        except Exception as e:
-            logger.error(f"Error processing {file_path}: {e}")
-            continue
-    
+
+    all_data, all_timepoints = _aggregate_excel_data(excel_files)
+
     if not all_data:
         logger.warning("No data extracted from any files")
-        return None
-    
+        return (None, None) if return_matrix else None
+
     # Sort timepoints
     sorted_timepoints = sort_timepoints_columns(all_timepoints)
-    
+
     # Include all timepoints up to and including the selected period
     # No filtering - all available data columns will be included
 
     logger.info(f"Extracted data from {len(all_data)} table types")
     logger.info(f"Total timepoints: {len(sorted_timepoints)}")
-    
-    # Create workbook
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Master Data"
-    
-    # Define styles
-    header_font = Font(bold=True)
-    section_font = Font(bold=True, size=12)
-    
-    row_idx = 1
-    
-    # Define the order of table types
-    table_order = [
-        'Retail Data Summary',
-        'Inventory Days',
-        'Two Wheeler (2W)',
-        'Two-Wheeler EV OEM',
-        'Three Wheeler (3W)',
-        'Three-Wheeler EV OEM',
-        '3W Subcategories',
-        'Passenger Vehicle (PV)',
-        'PV EV OEM',
-        'Commercial Vehicle (CV)',
-        'Commercial Vehicle EV OEM',
-        'Tractor (TRAC)',
-        'Construction Equipment',
-        'Retail Strength Urban',
-        'Retail Strength Rural',
-        'Road Tax Collection',
-        'EV Penetration',
-        'Fuel Wise Market Share',
-    ]
-    
-    # Add tables that are in order first
-    written_tables = set()
-    
-    for table_type in table_order:
-        if table_type in all_data:
-            written_tables.add(table_type)
-            table_data = all_data[table_type]
-            
-            # Section header
-            ws.cell(row_idx, 1, table_type).font = section_font
-            row_idx += 1
-            
-            # Column headers
-            ws.cell(row_idx, 1, "Item").font = header_font
-            for col_idx, tp in enumerate(sorted_timepoints, 2):
-                ws.cell(row_idx, col_idx, tp).font = header_font
-            row_idx += 1
-            
-            # Data rows - sort with TOTAL last
-            row_labels = sorted(table_data.keys(), 
-                              key=lambda x: (x.upper() == 'TOTAL' or x.upper() == 'TOTALS', x))
-            
-            for label in row_labels:
-                ws.cell(row_idx, 1, label)
-                for col_idx, tp in enumerate(sorted_timepoints, 2):
-                    val = table_data[label].get(tp)
-                    if val is not None:
-                        ws.cell(row_idx, col_idx, val)
-                row_idx += 1
-            
-            row_idx += 1  # Blank row between sections
-    
-    # Add any remaining tables not in the predefined order
-    for table_type in sorted(all_data.keys()):
-        if table_type in written_tables:
-            continue
-        
-        table_data = all_data[table_type]
-        
-        # Section header
-        ws.cell(row_idx, 1, table_type).font = section_font
-        row_idx += 1
-        
-        # Column headers
-        ws.cell(row_idx, 1, "Item").font = header_font
-        for col_idx, tp in enumerate(sorted_timepoints, 2):
-            ws.cell(row_idx, col_idx, tp).font = header_font
-        row_idx += 1
-        
-        # Data rows
-        row_labels = sorted(table_data.keys(), 
-                          key=lambda x: (x.upper() == 'TOTAL' or x.upper() == 'TOTALS', x))
-        
-        for label in row_labels:
-            ws.cell(row_idx, 1, label)
-            for col_idx, tp in enumerate(sorted_timepoints, 2):
-                val = table_data[label].get(tp)
-                if val is not None:
-                    ws.cell(row_idx, col_idx, val)
-            row_idx += 1
-        
-        row_idx += 1
-    
-    # Adjust column widths
-    ws.column_dimensions['A'].width = 45
-    for col_idx in range(2, len(sorted_timepoints) + 2):
-        ws.column_dimensions[chr(64 + col_idx) if col_idx <= 26 else 'A'].width = 12
-    
+
     # Generate filename with period info
     if output_period is not None:
         # Use the output period for filename
@@ -690,17 +607,10 @@ def build_consolidated_master(months: list = None, years: list = None,
     else:
         output_filename = "Master_FADA_Data.xlsx"
     
-    output_path = output_dir / output_filename
-    wb.save(output_path)
-    
-    # Log summary
-    total_rows = sum(len(v) for v in all_data.values())
-    logger.info(f"Master Excel saved to {output_path}")
-    logger.info(f"  - Table types: {len(all_data)}")
-    logger.info(f"  - Total row items: {total_rows}")
-    logger.info(f"  - Timepoint columns: {len(sorted_timepoints)}")
-    
-    return output_path
+    return _write_master_workbook(all_data, sorted_timepoints,
+                                  output_dir / output_filename,
+                                  return_matrix=return_matrix,
+                                  use_write_only=use_write_only)
 
 
 if __name__ == '__main__':
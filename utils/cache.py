@@ -5,10 +5,37 @@ Tracks processed PDFs to avoid re-downloading and re-processing.
 
 import json
 import hashlib
+import os
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, Optional, List
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows has no fcntl
+    fcntl = None
+
+
+def compute_file_hash(file_path: Path) -> str:
+    """
+    Compute a content hash for a file.
+
+    Uses blake2b with a 16-byte digest - faster than sha256 and more than
+    enough to detect a silently re-uploaded PDF with the same filename.
+
+    Args:
+        file_path: Path to the file to hash
+
+    Returns:
+        Hex digest string
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
 
 class ProcessingCache:
     """
@@ -36,12 +63,54 @@ class ProcessingCache:
                 return {'files': {}, 'metadata': {'last_updated': None}}
         return {'files': {}, 'metadata': {'last_updated': None}}
     
-    def save(self) -> None:
-        """Save cache to disk."""
-        self.cache['metadata']['last_updated'] = datetime.now().isoformat()
+    @contextmanager
+    def _locked(self):
+        """Hold an exclusive cross-process lock on the cache file.
+
+        Pipeline runs fan extraction out over a process pool, so several
+        worker processes can save the same cache file concurrently. The
+        lock lives on a sidecar .lock file; on platforms without fcntl
+        this degrades to no locking, where the atomic rename in
+        _write_atomic still prevents torn JSON.
+        """
         self.cache_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.cache_file, 'w', encoding='utf-8') as f:
+        lock_path = self.cache_file.with_suffix('.lock')
+        with open(lock_path, 'w') as lock_f:
+            if fcntl is not None:
+                fcntl.flock(lock_f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_f, fcntl.LOCK_UN)
+
+    def _write_atomic(self) -> None:
+        """Write the cache via a temp file and atomic rename."""
+        tmp_path = self.cache_file.with_name(
+            f'{self.cache_file.name}.{os.getpid()}.tmp'
+        )
+        with open(tmp_path, 'w', encoding='utf-8') as f:
             json.dump(self.cache, f, indent=2)
+        os.replace(tmp_path, self.cache_file)
+
+    def save(self) -> None:
+        """Merge this instance's entries into the on-disk cache and save.
+
+        Each process holds its own in-memory snapshot, so a plain
+        truncate-rewrite would make concurrent savers last-writer-wins and
+        silently drop each other's entries. Under the lock, the current
+        on-disk state is re-read and this instance's per-file entries are
+        layered on top before the atomic write, so parallel periods
+        accumulate instead of clobbering.
+        """
+        self.cache['metadata']['last_updated'] = datetime.now().isoformat()
+        with self._locked():
+            on_disk = self._load_cache()
+            for filename, info in self.cache['files'].items():
+                on_disk['files'].setdefault(filename, {}).update(info)
+            on_disk['metadata']['last_updated'] = self.cache['metadata']['last_updated']
+            self.cache = on_disk
+            self._write_atomic()
     
     def is_processed(self, filename: str) -> bool:
         """
@@ -86,26 +155,34 @@ class ProcessingCache:
             'path': str(file_path)
         })
     
-    def mark_processed(self, filename: str, excel_path: Path, month: int = None, year: int = None) -> None:
+    def mark_processed(self, filename: str, excel_path: Path, month: int = None, year: int = None,
+                       content_hash: str = None) -> None:
         """
         Mark a file as processed (converted to Excel).
-        
+
         Args:
             filename: Name of the PDF file
             excel_path: Path to generated Excel file
             month: Extracted month (1-12)
             year: Extracted year
+            content_hash: blake2b digest of the PDF bytes (see compute_file_hash)
         """
         if filename not in self.cache['files']:
             self.cache['files'][filename] = {}
-        
+
         self.cache['files'][filename].update({
             'processed': True,
             'process_time': datetime.now().isoformat(),
             'excel_path': str(excel_path),
             'month': month,
-            'year': year
+            'year': year,
+            'content_hash': content_hash
         })
+
+    def get_content_hash(self, filename: str) -> Optional[str]:
+        """Get the recorded content hash for a processed file, if any."""
+        info = self.cache['files'].get(filename)
+        return info.get('content_hash') if info else None
     
     def mark_failed(self, filename: str, error: str) -> None:
         """
@@ -154,8 +231,9 @@ class ProcessingCache:
     
     def clear(self) -> None:
         """Clear the cache."""
-        self.cache = {'files': {}, 'metadata': {'last_updated': None}}
-        self.save()
+        self.cache = {'files': {}, 'metadata': {'last_updated': datetime.now().isoformat()}}
+        with self._locked():
+            self._write_atomic()
     
     def get_stats(self) -> Dict:
         """Get cache statistics."""
@@ -16,9 +16,6 @@ from pathlib import Path
 import re
 from datetime import datetime
 
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from utils.logger import get_logger
 
 
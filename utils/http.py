@@ -0,0 +1,46 @@
+"""
+Shared HTTP Session for FADA ETL Pipeline
+One pooled requests.Session reused across the scraper and downloader.
+
+A fresh connection per request pays the TCP + TLS handshake every time;
+with keep-alive and a shared pool the handshake happens once per host.
+"""
+
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from config import FADA_CONFIG
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_http_session() -> requests.Session:
+    """
+    Get the process-wide pooled HTTP session, creating it on first use.
+
+    The session carries the standard FADA request headers, a connection
+    pool sized for the download thread pool, and transport-level retries
+    for transient connection failures.
+
+    Returns:
+        Shared requests.Session instance
+    """
+    global _session
+
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            session.headers.update(FADA_CONFIG['request_headers'])
+            adapter = HTTPAdapter(
+                pool_connections=16,
+                pool_maxsize=16,
+                max_retries=Retry(total=3, backoff_factor=0.3)
+            )
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            _session = session
+        return _session